@@ -42,7 +42,7 @@ def create_app():
     
     # Initialize Redis manager
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-    redis_manager = RedisManager(url=redis_url)
+    redis_manager = RedisManager(url=redis_url, client_name="booking-agent")
     
     # Create agent
     agent = BookingAgent(redis_manager=redis_manager)
@@ -72,6 +72,7 @@ if __name__ == "__main__":
         host=args.host,
         port=args.port,
         log_level="info",
+        timeout_keep_alive=BookingAgent.KEEP_ALIVE_TIMEOUT,
     )
 
 
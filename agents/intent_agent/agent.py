@@ -308,20 +308,24 @@ class IntentAgent(A2AServer):
                 metadata=enriched_metadata,
             ):
                 if isinstance(event, TaskStatusUpdateEvent):
-                    # Transform to use original task ID and add agent source
+                    # Transform to use original task ID and add agent source;
+                    # message-less statuses pass through without one
+                    status_message = event.status.message
+                    if status_message is not None:
+                        status_message = Message(
+                            role="agent",
+                            parts=[
+                                TextPart(
+                                    text=f"[{agent_name.title()}] "
+                                         f"{self._extract_text(status_message)}"
+                                ),
+                            ],
+                        )
                     transformed_status = TaskStatusUpdateEvent(
                         id=task_id,
                         status=TaskStatus(
                             state=event.status.state,
-                            message=Message(
-                                role="agent",
-                                parts=[
-                                    TextPart(
-                                        text=f"[{agent_name.title()}] "
-                                             f"{self._extract_text(event.status.message) if event.status.message else event.status.state}"
-                                    ),
-                                ],
-                            ) if event.status.message else event.status.message,
+                            message=status_message,
                         ),
                         final=event.final,
                     )
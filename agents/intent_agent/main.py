@@ -44,7 +44,7 @@ def create_app(use_mock: bool = False):
     
     # Initialize Redis manager
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-    redis_manager = RedisManager(url=redis_url)
+    redis_manager = RedisManager(url=redis_url, client_name="intent-agent")
     
     # Create agent
     agent = IntentAgent(
@@ -108,6 +108,7 @@ if __name__ == "__main__":
         host=args.host,
         port=args.port,
         log_level="info",
+        timeout_keep_alive=IntentAgent.KEEP_ALIVE_TIMEOUT,
     )
 
 
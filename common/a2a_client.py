@@ -43,18 +43,28 @@ class A2AClient:
     - Resubscribing to tasks
     - Getting task status
     - Canceling tasks
+    
+    An existing httpx client can be passed in to share its connection
+    pool; it is then used as-is and left open on disconnect.
     """
     
+    # Idle pooled connections are closed a little before the agents'
+    # server-side A2AServer.KEEP_ALIVE_TIMEOUT, so the client never reuses
+    # a connection the server is about to drop.
+    KEEPALIVE_EXPIRY = 60.0
+    
     def __init__(
         self,
         base_url: str,
         timeout: float = 60.0,
         headers: Optional[Dict[str, str]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.headers = headers or {}
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
         
     async def __aenter__(self):
         await self.connect()
@@ -65,14 +75,17 @@ class A2AClient:
         
     async def connect(self):
         """Initialize the HTTP client."""
+        if not self._owns_client:
+            return
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(self.timeout),
             headers=self.headers,
+            limits=httpx.Limits(keepalive_expiry=self.KEEPALIVE_EXPIRY),
         )
         
     async def disconnect(self):
         """Close the HTTP client."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
             
@@ -172,7 +185,13 @@ class A2AClient:
             f"{self.base_url}/tasks/sendSubscribe",
             json=request.model_dump(exclude_none=True),
         ) as event_source:
+            # Read to EOF rather than breaking out on the terminal event:
+            # leaving early closes the response mid-body, so its keep-alive
+            # connection cannot be returned to the pool for the next request.
+            finished = False
             async for event in event_source.aiter_sse():
+                if finished:
+                    continue
                 logger.debug("Received SSE event", event_type=event.event, data=event.data)
                 
                 if event.event == "status":
@@ -183,7 +202,7 @@ class A2AClient:
                     if data.get("final") or data.get("status", {}).get("state") in [
                         "completed", "failed", "canceled"
                     ]:
-                        break
+                        finished = True
                         
                 elif event.event == "artifact":
                     data = json.loads(event.data)
@@ -217,13 +236,17 @@ class A2AClient:
             f"{self.base_url}/tasks/resubscribe",
             json=request,
         ) as event_source:
+            # Drain to EOF after the final event (see send_subscribe).
+            finished = False
             async for event in event_source.aiter_sse():
+                if finished:
+                    continue
                 if event.event == "status":
                     data = json.loads(event.data)
                     yield TaskStatusUpdateEvent(**data)
                     
                     if data.get("final"):
-                        break
+                        finished = True
                         
                 elif event.event == "artifact":
                     data = json.loads(event.data)
@@ -50,6 +50,11 @@ class A2AServer(ABC):
     - POST /tasks/cancel - Cancel a task
     """
     
+    # Seconds uvicorn keeps an idle client connection open (its default is
+    # 5 s). Agents call each other and the demo clients idle between
+    # requests, so a longer timeout lets them reuse pooled connections.
+    KEEP_ALIVE_TIMEOUT = 75
+    
     def __init__(
         self,
         agent_card: AgentCard,
@@ -171,6 +176,7 @@ class A2AServer(ABC):
                 
                 if self.redis:
                     await self.redis.store_task(task)
+                    self.redis.forget_task(task.id)
                 
                 return SendTaskResponse(
                     id=req.id,
@@ -235,13 +241,16 @@ class A2AServer(ABC):
                             params.metadata,
                         ):
                             if isinstance(event, TaskStatusUpdateEvent):
+                                # Serialize once for both SSE and Redis
+                                event_json = event.model_dump_json()
+                                
                                 # Publish to Redis for other subscribers
                                 if self.redis:
-                                    await self.redis.publish_status(task.id, event)
+                                    self.redis.publish_status_nowait(task.id, event, event_json)
                                 
                                 yield {
                                     "event": "status",
-                                    "data": event.model_dump_json(),
+                                    "data": event_json,
                                 }
                                 
                                 # Check if final
@@ -254,13 +263,14 @@ class A2AServer(ABC):
                                     
                             elif isinstance(event, TaskArtifactUpdateEvent):
                                 artifacts.append(event.artifact)
+                                event_json = event.model_dump_json()
                                 
                                 if self.redis:
-                                    await self.redis.publish_artifact(task.id, event)
+                                    self.redis.publish_artifact_nowait(task.id, event, event_json)
                                 
                                 yield {
                                     "event": "artifact",
-                                    "data": event.model_dump_json(),
+                                    "data": event_json,
                                 }
                         
                         # Update final task state
@@ -268,6 +278,7 @@ class A2AServer(ABC):
                         self.tasks[task.id] = task
                         
                         if self.redis:
+                            await self.redis.flush_publishes(task.id)
                             await self.redis.store_task(task)
                             await self.redis.remove_subscription(task.id, self.agent_card.name)
                             
@@ -291,6 +302,10 @@ class A2AServer(ABC):
                             "event": "status",
                             "data": error_event.model_dump_json(),
                         }
+                    finally:
+                        # Covers completion, errors and client disconnects
+                        if self.redis:
+                            self.redis.forget_task(task.id)
                 
                 return EventSourceResponse(event_generator())
                 
@@ -396,12 +411,15 @@ class A2AServer(ABC):
                 
                 if self.redis:
                     await self.redis.store_task(task)
+                    # Events still queued by publish_*_nowait go out first
+                    await self.redis.flush_publishes(task_id)
                     cancel_event = TaskStatusUpdateEvent(
                         id=task_id,
                         status=task.status,
                         final=True,
                     )
                     await self.redis.publish_status(task_id, cancel_event)
+                    self.redis.forget_task(task_id)
             
             return {
                 "jsonrpc": "2.0",
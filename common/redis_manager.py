@@ -9,11 +9,27 @@ Handles:
 """
 
 import asyncio
+import functools
 import json
-from typing import AsyncGenerator, Dict, List, Optional, Any
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
 from datetime import datetime, timedelta
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+from redis.utils import HIREDIS_AVAILABLE
 import structlog
 
 from .a2a_protocol import (
@@ -28,6 +44,14 @@ from .a2a_protocol import (
 logger = structlog.get_logger()
 
 
+class TaskKeys(NamedTuple):
+    """Redis key names used for a single task."""
+    task: str
+    stream: str
+    channel: str
+    subscriptions: str
+
+
 class RedisManager:
     """
     Redis manager for A2A protocol state management.
@@ -53,64 +77,196 @@ class RedisManager:
     # TTL for task data (24 hours default)
     TASK_TTL = 60 * 60 * 24
     
+    # Connection pool tuning for commands and publishes. The pool blocks
+    # for up to POOL_TIMEOUT seconds when every connection is in use
+    # instead of failing with "Too many connections". Pub/Sub subscribers
+    # hold their connection for the whole subscription, so they get a
+    # separate, unbounded pool and can never starve ordinary commands.
+    MAX_CONNECTIONS = 64
+    POOL_TIMEOUT = 20
+    HEALTH_CHECK_INTERVAL = 30
+    
+    # Stream retention: approximate (~) trimming keeps XADD O(1) amortized,
+    # and the stream TTL is only refreshed once per interval per task.
+    STREAM_MAXLEN = 1000
+    STREAM_TTL_REFRESH_INTERVAL = 60
+    
+    # Upper bound on concurrent fire-and-forget publishes (see publish_*_nowait).
+    # Kept well below MAX_CONNECTIONS so ordinary commands and pub/sub
+    # subscribers still get connections while publishes are backed up.
+    MAX_CONCURRENT_PUBLISHES = 16
+    
+    # Splice a new status object into an existing task JSON string and
+    # refresh its TTL. The first '"status":' in the text is always the
+    # top-level key: only string fields precede it, and quotes inside
+    # JSON strings are escaped. The old value is skipped by brace depth.
+    UPDATE_STATUS_SCRIPT = """
+    local raw = redis.call("GET", KEYS[1])
+    if not raw then
+        return 0
+    end
+    local start = string.find(raw, '"status":', 1, true)
+    if not start then
+        return 0
+    end
+    local first = start + 9
+    local depth, in_string, escaped = 0, false, false
+    for i = first, #raw do
+        local c = string.byte(raw, i)
+        if in_string then
+            if escaped then
+                escaped = false
+            elseif c == 92 then
+                escaped = true
+            elseif c == 34 then
+                in_string = false
+            end
+        elseif c == 34 then
+            in_string = true
+        elseif c == 123 then
+            depth = depth + 1
+        elseif c == 125 then
+            depth = depth - 1
+            if depth == 0 then
+                local patched = string.sub(raw, 1, first - 1) .. ARGV[1] .. string.sub(raw, i + 1)
+                redis.call("SET", KEYS[1], patched, "EX", ARGV[2])
+                return 1
+            end
+        end
+    end
+    return 0
+    """
+    
     def __init__(
         self,
         url: str = "redis://localhost:6379",
         password: Optional[str] = None,
         db: int = 0,
+        max_connections: int = MAX_CONNECTIONS,
+        client_name: Optional[str] = None,
     ):
         self.url = url
         self.password = password
         self.db = db
+        self.max_connections = max_connections
+        self.client_name = client_name
         self._client: Optional[redis.Redis] = None
         self._pubsub: Optional[redis.client.PubSub] = None
+        self._pubsub_client: Optional[redis.Redis] = None
+        self._update_status_script: Optional[AsyncScript] = None
+        self._stream_ttl_refreshed_at: Dict[str, float] = {}
+        self._keys: Dict[str, TaskKeys] = {}
+        self._publish_slots = asyncio.Semaphore(
+            min(self.MAX_CONCURRENT_PUBLISHES, max_connections)
+        )
+        self._publish_queues: Dict[str, Deque[Callable[[], Awaitable[None]]]] = {}
+        self._publish_workers: Dict[str, asyncio.Task] = {}
         
     async def connect(self):
-        """Connect to Redis."""
-        self._client = redis.Redis.from_url(
+        """
+        Connect to Redis.
+        
+        redis-py picks the hiredis C parser automatically when the
+        ``hiredis`` package is installed (it is pinned in requirements.txt).
+        """
+        self._update_status_script = None
+        pool = redis.BlockingConnectionPool.from_url(
             self.url,
             password=self.password,
             db=self.db,
             decode_responses=True,
+            max_connections=self.max_connections,
+            timeout=self.POOL_TIMEOUT,
+            health_check_interval=self.HEALTH_CHECK_INTERVAL,
+            socket_keepalive=True,
+            client_name=self.client_name,
+        )
+        # from_pool() hands the pool to the client, so aclose() closes it
+        self._client = redis.Redis.from_pool(pool)
+        self._pubsub_client = redis.Redis.from_url(
+            self.url,
+            password=self.password,
+            db=self.db,
+            decode_responses=True,
+            health_check_interval=self.HEALTH_CHECK_INTERVAL,
+            socket_keepalive=True,
+            client_name=self.client_name,
         )
         await self._client.ping()
-        logger.info("Connected to Redis", url=self.url)
+        logger.info(
+            "Connected to Redis",
+            url=self.url,
+            max_connections=self.max_connections,
+            hiredis=HIREDIS_AVAILABLE,
+        )
         
     async def disconnect(self):
         """Disconnect from Redis."""
+        if self._publish_workers:
+            await asyncio.wait(list(self._publish_workers.values()))
         if self._pubsub:
             await self._pubsub.close()
-        if self._client:
-            # redis-py 5.x prefers aclose(); close() is deprecated.
-            aclose = getattr(self._client, "aclose", None)
-            if callable(aclose):
-                await aclose()
-            else:
-                await self._client.close()
+        for client in (self._pubsub_client, self._client):
+            if client:
+                # redis-py 5.x prefers aclose(); close() is deprecated.
+                aclose = getattr(client, "aclose", None)
+                if callable(aclose):
+                    await aclose()
+                else:
+                    await client.close()
         logger.info("Disconnected from Redis")
         
+    async def reset_local_state(self) -> None:
+        """
+        Forget all per-task state held in this process.
+        
+        Waits for scheduled publishes to finish, then drops cached keys
+        and stream TTL bookkeeping. Use together with wiping the Redis
+        data itself (e.g. FLUSHDB between tests) so nothing cached refers
+        to keys that no longer exist.
+        """
+        if self._publish_workers:
+            await asyncio.wait(list(self._publish_workers.values()))
+        self._keys.clear()
+        self._stream_ttl_refreshed_at.clear()
+        
     @property
     def client(self) -> redis.Redis:
         if not self._client:
             raise RuntimeError("Redis not connected. Call connect() first.")
         return self._client
     
+    def _task_keys(self, task_id: str) -> TaskKeys:
+        """
+        Return the Redis keys for a task.
+        
+        Keys are cached when a task is stored so publish/subscribe calls
+        on the hot path do not rebuild the same strings per event.
+        """
+        keys = self._keys.get(task_id)
+        if keys is None:
+            keys = TaskKeys(
+                task=f"{self.TASK_KEY_PREFIX}{task_id}",
+                stream=f"{self.TASK_KEY_PREFIX}{task_id}{self.STREAM_KEY_SUFFIX}",
+                channel=f"{self.CHANNEL_PREFIX}{task_id}",
+                subscriptions=f"{self.SUBSCRIPTIONS_PREFIX}{task_id}",
+            )
+        return keys
+    
     # =========================================================================
     # Task State Management
     # =========================================================================
     
     async def store_task(self, task: Task) -> None:
         """Store a task in Redis."""
-        key = f"{self.TASK_KEY_PREFIX}{task.id}"
-        data = task.model_dump_json()
-        
-        await self.client.set(key, data, ex=self.TASK_TTL)
+        keys = self._task_keys(task.id)
+        self._keys[task.id] = keys
+        await self.client.set(keys.task, task.model_dump_json(), ex=self.TASK_TTL)
         logger.debug("Stored task", task_id=task.id)
         
     async def get_task(self, task_id: str) -> Optional[Task]:
         """Retrieve a task from Redis."""
-        key = f"{self.TASK_KEY_PREFIX}{task_id}"
-        data = await self.client.get(key)
+        data = await self.client.get(self._task_keys(task_id).task)
         
         if data:
             return Task(**json.loads(data))
@@ -121,22 +277,51 @@ class RedisManager:
         task_id: str,
         status: TaskStatus,
     ) -> None:
-        """Update task status and refresh TTL."""
-        task = await self.get_task(task_id)
-        if task:
-            task.status = status
-            await self.store_task(task)
+        """
+        Update task status and refresh TTL.
+        
+        The status is patched inside the stored JSON by a Lua script, in a
+        single round trip. Unknown tasks are left untouched.
+        """
+        if self._update_status_script is None:
+            self._update_status_script = self.client.register_script(
+                self.UPDATE_STATUS_SCRIPT
+            )
+        await self._update_status_script(
+            keys=[self._task_keys(task_id).task],
+            args=[status.model_dump_json(), self.TASK_TTL],
+        )
             
     async def delete_task(self, task_id: str) -> None:
         """Delete a task from Redis."""
-        keys = [
-            f"{self.TASK_KEY_PREFIX}{task_id}",
-            f"{self.TASK_KEY_PREFIX}{task_id}{self.STREAM_KEY_SUFFIX}",
-            f"{self.SUBSCRIPTIONS_PREFIX}{task_id}",
-        ]
-        await self.client.delete(*keys)
+        keys = self._task_keys(task_id)
+        await self.client.delete(keys.task, keys.stream, keys.subscriptions)
+        self._keys.pop(task_id, None)
+        self._stream_ttl_refreshed_at.pop(task_id, None)
         logger.debug("Deleted task", task_id=task_id)
         
+    def forget_task(self, task_id: str) -> None:
+        """
+        Drop the cached state for a task this process has finished with.
+        
+        The task's Redis data is left alone; only the cached keys and the
+        stream TTL bookkeeping are released, so they do not grow with every
+        task a long-running agent has handled. The next event for the task,
+        if any, refreshes the stream TTL again.
+        """
+        self._keys.pop(task_id, None)
+        if task_id in self._publish_queues:
+            # Queued publishes would record a TTL refresh again; forget it
+            # after they have run.
+            self._schedule_publish(
+                task_id, functools.partial(self._forget_stream_ttl, task_id)
+            )
+        else:
+            self._stream_ttl_refreshed_at.pop(task_id, None)
+            
+    async def _forget_stream_ttl(self, task_id: str) -> None:
+        self._stream_ttl_refreshed_at.pop(task_id, None)
+        
     # =========================================================================
     # Subscription Management
     # =========================================================================
@@ -147,7 +332,7 @@ class RedisManager:
         subscriber: str,
     ) -> None:
         """Add a subscriber to a task."""
-        key = f"{self.SUBSCRIPTIONS_PREFIX}{task_id}"
+        key = self._task_keys(task_id).subscriptions
         await self.client.sadd(key, subscriber)
         await self.client.expire(key, self.TASK_TTL)
         logger.debug("Added subscription", task_id=task_id, subscriber=subscriber)
@@ -158,18 +343,18 @@ class RedisManager:
         subscriber: str,
     ) -> None:
         """Remove a subscriber from a task."""
-        key = f"{self.SUBSCRIPTIONS_PREFIX}{task_id}"
+        key = self._task_keys(task_id).subscriptions
         await self.client.srem(key, subscriber)
         logger.debug("Removed subscription", task_id=task_id, subscriber=subscriber)
         
     async def get_subscribers(self, task_id: str) -> List[str]:
         """Get all subscribers for a task."""
-        key = f"{self.SUBSCRIPTIONS_PREFIX}{task_id}"
+        key = self._task_keys(task_id).subscriptions
         return list(await self.client.smembers(key))
     
     async def has_subscribers(self, task_id: str) -> bool:
         """Check if a task has any active subscribers."""
-        key = f"{self.SUBSCRIPTIONS_PREFIX}{task_id}"
+        key = self._task_keys(task_id).subscriptions
         return await self.client.scard(key) > 0
     
     # =========================================================================
@@ -180,36 +365,175 @@ class RedisManager:
         self,
         task_id: str,
         event: TaskStatusUpdateEvent,
+        event_json: Optional[str] = None,
     ) -> None:
-        """Publish a status update to all subscribers."""
-        channel = f"{self.CHANNEL_PREFIX}{task_id}"
-        message = {
-            "type": "status",
-            "data": event.model_dump(),
-        }
-        await self.client.publish(channel, json.dumps(message))
+        """
+        Publish a status update to all subscribers.
+        
+        Callers that already serialized the event (e.g. for SSE) can pass
+        it as ``event_json`` so it is not encoded again.
+        """
+        if event_json is None:
+            event_json = event.model_dump_json()
+        channel = self._task_keys(task_id).channel
+        await self.client.publish(channel, self._envelope("status", event_json))
         
         # Also add to stream for resubscription
-        await self._add_to_stream(task_id, "status", event.model_dump())
+        await self._add_to_stream(task_id, "status", event_json)
+        if event.final:
+            # No further events expected; stop tracking the stream TTL.
+            self._stream_ttl_refreshed_at.pop(task_id, None)
         logger.debug("Published status", task_id=task_id, state=event.status.state)
         
     async def publish_artifact(
         self,
         task_id: str,
         event: TaskArtifactUpdateEvent,
+        event_json: Optional[str] = None,
     ) -> None:
         """Publish an artifact update to all subscribers."""
-        channel = f"{self.CHANNEL_PREFIX}{task_id}"
-        message = {
-            "type": "artifact",
-            "data": event.model_dump(),
-        }
-        await self.client.publish(channel, json.dumps(message))
+        if event_json is None:
+            event_json = event.model_dump_json()
+        channel = self._task_keys(task_id).channel
+        await self.client.publish(channel, self._envelope("artifact", event_json))
         
         # Also add to stream for resubscription
-        await self._add_to_stream(task_id, "artifact", event.model_dump())
+        await self._add_to_stream(task_id, "artifact", event_json)
         logger.debug("Published artifact", task_id=task_id)
         
+    async def publish_many(
+        self,
+        task_id: str,
+        events: List[Union[TaskStatusUpdateEvent, TaskArtifactUpdateEvent]],
+    ) -> None:
+        """
+        Publish several events for a task in one pipelined round trip.
+        
+        Each event is published to the task channel and appended to its
+        stream in order, exactly as publish_status/publish_artifact would.
+        """
+        if not events:
+            return
+        keys = self._task_keys(task_id)
+        now = time.monotonic()
+        refreshed_at = self._stream_ttl_refreshed_at.get(task_id)
+        refresh_ttl = (
+            refreshed_at is None
+            or now - refreshed_at >= self.STREAM_TTL_REFRESH_INTERVAL
+        )
+        final = False
+        
+        async with self.client.pipeline(transaction=False) as pipe:
+            for event in events:
+                if isinstance(event, TaskStatusUpdateEvent):
+                    event_type = "status"
+                    final = event.final
+                else:
+                    event_type = "artifact"
+                event_json = event.model_dump_json()
+                pipe.publish(keys.channel, self._envelope(event_type, event_json))
+                pipe.xadd(
+                    keys.stream,
+                    {"type": event_type, "data": event_json},
+                    maxlen=self.STREAM_MAXLEN,
+                    approximate=True,
+                )
+            if refresh_ttl:
+                pipe.expire(keys.stream, self.TASK_TTL)
+            await pipe.execute()
+        
+        if final:
+            # No further events expected; stop tracking the stream TTL.
+            self._stream_ttl_refreshed_at.pop(task_id, None)
+        elif refresh_ttl:
+            self._stream_ttl_refreshed_at[task_id] = now
+        logger.debug("Published events", task_id=task_id, count=len(events))
+        
+    @staticmethod
+    def _envelope(event_type: str, event_json: str) -> str:
+        """Wrap already-serialized event JSON in a pub/sub message."""
+        return f'{{"type":"{event_type}","data":{event_json}}}'
+        
+    def publish_status_nowait(
+        self,
+        task_id: str,
+        event: TaskStatusUpdateEvent,
+        event_json: Optional[str] = None,
+    ) -> None:
+        """
+        Schedule publish_status without waiting on Redis.
+        
+        Used on streaming hot paths so the Redis round trip stays off the
+        client-facing critical path. Events for the same task are still
+        published in order; failures are logged, not raised.
+        """
+        self._schedule_publish(
+            task_id,
+            functools.partial(self.publish_status, task_id, event, event_json),
+        )
+        
+    def publish_artifact_nowait(
+        self,
+        task_id: str,
+        event: TaskArtifactUpdateEvent,
+        event_json: Optional[str] = None,
+    ) -> None:
+        """Schedule publish_artifact without waiting on Redis."""
+        self._schedule_publish(
+            task_id,
+            functools.partial(self.publish_artifact, task_id, event, event_json),
+        )
+        
+    async def flush_publishes(self, task_id: str) -> None:
+        """Wait until all scheduled publishes for a task have finished."""
+        worker = self._publish_workers.get(task_id)
+        if worker is not None:
+            await asyncio.wait([worker])
+            
+    def _schedule_publish(
+        self,
+        task_id: str,
+        publish: Callable[[], Awaitable[None]],
+    ) -> None:
+        """
+        Queue a publish behind any still-pending publishes for the same task.
+        
+        Each task with pending publishes has a single worker draining its
+        queue in order, so a burst of events adds queue entries, not
+        asyncio tasks.
+        """
+        queue = self._publish_queues.get(task_id)
+        if queue is not None:
+            queue.append(publish)
+            return
+        self._publish_queues[task_id] = deque([publish])
+        self._publish_workers[task_id] = asyncio.create_task(
+            self._drain_publishes(task_id)
+        )
+        
+    async def _drain_publishes(self, task_id: str) -> None:
+        """
+        Run a task's queued publishes in order until the queue is empty.
+        
+        Each publish waits for one of the publish slots, so at most
+        MAX_CONCURRENT_PUBLISHES connections are used for them; failures
+        are logged, not raised.
+        """
+        queue = self._publish_queues[task_id]
+        try:
+            while queue:
+                publish = queue.popleft()
+                try:
+                    async with self._publish_slots:
+                        await publish()
+                except Exception as e:
+                    logger.error("Failed to publish event", task_id=task_id, error=str(e))
+        finally:
+            # Nothing can be queued between the empty check and this cleanup,
+            # since there is no await in between.
+            del self._publish_queues[task_id]
+            del self._publish_workers[task_id]
+        
     async def subscribe_to_task(
         self,
         task_id: str,
@@ -224,15 +548,15 @@ class RedisManager:
         Yields:
             SSE-formatted event dictionaries
         """
-        channel = f"{self.CHANNEL_PREFIX}{task_id}"
+        channel = self._task_keys(task_id).channel
         
         # Replay from stream if requested
         if from_beginning:
             async for event in self._read_stream(task_id):
                 yield event
         
-        # Subscribe to live updates
-        pubsub = self.client.pubsub()
+        # Subscribe to live updates on the subscriber pool (see MAX_CONNECTIONS)
+        pubsub = (self._pubsub_client or self.client).pubsub()
         await pubsub.subscribe(channel)
         
         try:
@@ -267,20 +591,33 @@ class RedisManager:
         self,
         task_id: str,
         event_type: str,
-        data: Dict[str, Any],
+        event_json: str,
     ) -> None:
-        """Add an event to the task's stream."""
-        key = f"{self.TASK_KEY_PREFIX}{task_id}{self.STREAM_KEY_SUFFIX}"
-        await self.client.xadd(
-            key,
-            {
-                "type": event_type,
-                "data": json.dumps(data),
-                "timestamp": datetime.utcnow().isoformat(),
-            },
-            maxlen=1000,  # Keep last 1000 events per task
-        )
-        await self.client.expire(key, self.TASK_TTL)
+        """
+        Add an event to the task's stream.
+        
+        Entries carry no separate timestamp: stream entry IDs are
+        ``<ms>-<seq>`` and already record when each event was added.
+        """
+        key = self._task_keys(task_id).stream
+        fields = {
+            "type": event_type,
+            "data": event_json,
+        }
+        
+        now = time.monotonic()
+        refreshed_at = self._stream_ttl_refreshed_at.get(task_id)
+        if refreshed_at is not None and now - refreshed_at < self.STREAM_TTL_REFRESH_INTERVAL:
+            await self.client.xadd(
+                key, fields, maxlen=self.STREAM_MAXLEN, approximate=True
+            )
+            return
+        
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, fields, maxlen=self.STREAM_MAXLEN, approximate=True)
+            pipe.expire(key, self.TASK_TTL)
+            await pipe.execute()
+        self._stream_ttl_refreshed_at[task_id] = now
         
     async def _read_stream(
         self,
@@ -289,17 +626,15 @@ class RedisManager:
         count: Optional[int] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Read events from a task's stream."""
-        key = f"{self.TASK_KEY_PREFIX}{task_id}{self.STREAM_KEY_SUFFIX}"
+        key = self._task_keys(task_id).stream
         
         messages = await self.client.xrange(key, min=start, count=count)
         
         for msg_id, fields in messages:
-            event_type = fields.get("type")
-            data = json.loads(fields.get("data", "{}"))
-            
+            # Stream entries already hold the event's JSON encoding.
             yield {
-                "event": event_type,
-                "data": json.dumps(data),
+                "event": fields.get("type"),
+                "data": fields.get("data", "{}"),
             }
             
     async def get_stream_events(
@@ -317,31 +652,31 @@ class RedisManager:
     # Utility Methods
     # =========================================================================
     
+    async def iter_active_tasks(
+        self,
+        pattern: str = "*",
+    ) -> AsyncGenerator[str, None]:
+        """
+        Yield active task IDs matching a pattern.
+        
+        IDs are produced one SCAN batch at a time, so callers that stop
+        early or process tasks as they go never hold the full key set.
+        """
+        prefix_len = len(self.TASK_KEY_PREFIX)
+        async for key in self.client.scan_iter(
+            match=f"{self.TASK_KEY_PREFIX}{pattern}",
+            count=100,
+        ):
+            # Skip stream keys
+            if not key.endswith(self.STREAM_KEY_SUFFIX):
+                yield key[prefix_len:]
+    
     async def get_active_tasks(
         self,
         pattern: str = "*",
     ) -> List[str]:
         """Get all active task IDs matching a pattern."""
-        cursor = 0
-        task_ids = []
-        
-        while True:
-            cursor, keys = await self.client.scan(
-                cursor=cursor,
-                match=f"{self.TASK_KEY_PREFIX}{pattern}",
-                count=100,
-            )
-            
-            for key in keys:
-                # Skip stream keys
-                if not key.endswith(self.STREAM_KEY_SUFFIX):
-                    task_id = key.replace(self.TASK_KEY_PREFIX, "")
-                    task_ids.append(task_id)
-                    
-            if cursor == 0:
-                break
-                
-        return task_ids
+        return [task_id async for task_id in self.iter_active_tasks(pattern)]
     
     async def cleanup_completed_tasks(
         self,
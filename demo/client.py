@@ -8,18 +8,35 @@ status streaming visualization.
 import asyncio
 import os
 import sys
-from datetime import datetime
-from typing import Optional
+import threading
+import time
+from typing import List, Optional
 
 from dotenv import load_dotenv
 import structlog
 
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:  # pragma: no cover
+    import json
+    
+    _loads = json.loads
+    
+    def _dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.a2a_client import A2AClient
 from common.a2a_protocol import (
     Message,
+    Part,
     TextPart,
     TaskStatusUpdateEvent,
     TaskArtifactUpdateEvent,
@@ -38,7 +55,7 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
-class Colors:
+class _ColorsOn:
     """ANSI color codes for terminal output."""
     RESET = "\033[0m"
     BOLD = "\033[1m"
@@ -60,21 +77,51 @@ class Colors:
     BG_RED = "\033[41m"
 
 
-def print_header():
-    """Print demo header."""
-    print(f"""
+# Same attribute names as _ColorsOn, each set to "" (no escape codes).
+_ColorsOff = type(
+    "_ColorsOff",
+    (),
+    {name: "" for name in vars(_ColorsOn) if name.isupper()},
+)
+
+# Skip ANSI escapes entirely when output is piped or NO_COLOR is set
+# (https://no-color.org/).
+USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+Colors = _ColorsOn() if USE_COLOR else _ColorsOff()
+
+# Output is pre-encoded to bytes and written below the TextIOWrapper, so
+# the per-write str -> bytes encode step is skipped on the hot path.
+_ENCODING = sys.stdout.encoding or "utf-8"
+
+
+def _encode(text: str) -> bytes:
+    return text.encode(_ENCODING, "replace")
+
+
+def _write_bytes(data: bytes) -> None:
+    """Write pre-encoded output to stdout (the caller flushes)."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. captured output)
+        sys.stdout.write(data.decode(_ENCODING, "replace"))
+        return
+    # Push out pending print() text first so output stays in order
+    sys.stdout.flush()
+    buffer.write(data)
+
+
+# Static banners, rendered once at import (print() added the final newline).
+_HEADER = _encode(f"""
 {Colors.BOLD}{Colors.CYAN}╔══════════════════════════════════════════════════════════════════╗
 ║       A2A Customer Service - Status Streaming Demo               ║
 ║                                                                  ║
 ║  This demo shows real-time status streaming using Google's       ║
 ║  A2A protocol (sendSubscribe) with SSE.                          ║
 ╚══════════════════════════════════════════════════════════════════╝{Colors.RESET}
-""")
 
+""")
 
-def print_flow_diagram():
-    """Print the agent flow diagram."""
-    print(f"""
+_FLOW = _encode(f"""
 {Colors.DIM}┌─────────────────────────────────────────────────────────────────┐
 │                        REQUEST FLOW                             │
 ├─────────────────────────────────────────────────────────────────┤
@@ -88,62 +135,182 @@ def print_flow_diagram():
 │      │◀───────────────────│        (SSE streaming)              │
 │                                                                 │
 └─────────────────────────────────────────────────────────────────┘{Colors.RESET}
+
 """)
 
+_SAMPLES = _encode(f"""
+{Colors.BOLD}Sample requests to try:{Colors.RESET}
+{Colors.GREEN}Booking:{Colors.RESET}
+  • "I'd like to book an appointment for next Monday at 2pm"
+  • "Check availability for December 20th"
+  • "Cancel my booking BK1001"
+
+{Colors.GREEN}Billing:{Colors.RESET}
+  • "Show me my pending invoices"
+  • "I need to pay invoice INV5002"
+  • "Request a refund for INV5001"
+
+{Colors.DIM}Type 'quit' or 'exit' to stop, 'clear' to clear screen{Colors.RESET}
+
+""")
+
+
+def print_header():
+    """Print demo header."""
+    _write_bytes(_HEADER)
+
+
+def print_flow_diagram():
+    """Print the agent flow diagram."""
+    _write_bytes(_FLOW)
+
+
+# TaskState members bound once at module level
+_SUBMITTED = TaskState.SUBMITTED
+_WORKING = TaskState.WORKING
+_COMPLETED = TaskState.COMPLETED
+_FAILED = TaskState.FAILED
+_CANCELED = TaskState.CANCELED
+_INPUT_REQUIRED = TaskState.INPUT_REQUIRED
+
+# State-specific formatting: (color, icon)
+_STATE_STYLE = {
+    _SUBMITTED: (Colors.YELLOW, "📤"),
+    _WORKING: (Colors.BLUE, "⚙️ "),
+    _COMPLETED: (Colors.GREEN, "✅"),
+    _FAILED: (Colors.RED, "❌"),
+    _CANCELED: (Colors.YELLOW, "🚫"),
+    _INPUT_REQUIRED: (Colors.MAGENTA, "❓"),
+}
+_DEFAULT_STYLE = (Colors.WHITE, "•")
+
+
+def _state_prefix(state: TaskState, color: str, icon: str) -> bytes:
+    return _encode(f"{icon} {color}{state.value.upper()}{Colors.RESET}: ")
+
+
+# Fixed decoration around each event line, rendered once per state
+_STATE_PREFIX = {
+    state: _state_prefix(state, color, icon)
+    for state, (color, icon) in _STATE_STYLE.items()
+}
+_TS_PREFIX = _encode(f"{Colors.DIM}[")
+_TS_SUFFIX = _encode(f"]{Colors.RESET} ")
+_ARTIFACT_PREFIX = _encode(f"📦 {Colors.CYAN}ARTIFACT{Colors.RESET}: ")
+_ARTIFACT_BODY_PREFIX = _encode(f"\n{Colors.DIM}└─{Colors.RESET} ")
+
+
+# [epoch milliseconds, formatted] of the last rendered timestamp; events
+# in the same burst usually share a millisecond.
+_ts_cache = [0, b""]
+
+
+def _timestamp() -> bytes:
+    """Return the local wall-clock time as encoded HH:MM:SS.mmm."""
+    ms = time.time_ns() // 1_000_000
+    if ms != _ts_cache[0]:
+        _ts_cache[0] = ms
+        _ts_cache[1] = (
+            f"{time.strftime('%H:%M:%S', time.localtime(ms // 1000))}.{ms % 1000:03d}"
+        ).encode()
+    return _ts_cache[1]
+
 
-def format_status_event(event: TaskStatusUpdateEvent) -> str:
-    """Format a status update event for display."""
+def _first_text(parts: List[Part]) -> str:
+    """Return the text of the first TextPart, or an empty string."""
+    return next((p.text for p in parts if isinstance(p, TextPart)), "")
+
+
+def _format_preview(text: str, limit: int = 200) -> str:
+    """Pretty-print JSON artifact text, then truncate it to ``limit`` chars."""
+    if text[:1] in ("{", "["):
+        try:
+            text = _dumps_pretty(_loads(text))
+        except ValueError:
+            pass
+    preview = text[:limit] + ("..." if len(text) > limit else "")
+    # Keep continuation lines aligned under the "└─" marker
+    return preview.replace("\n", "\n   ")
+
+
+def format_status_event(event: TaskStatusUpdateEvent) -> bytes:
+    """Format a status update event for display, including its blank separator line."""
     state = event.status.state
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-    
-    # State-specific formatting
-    state_colors = {
-        TaskState.SUBMITTED: (Colors.YELLOW, "📤"),
-        TaskState.WORKING: (Colors.BLUE, "⚙️ "),
-        TaskState.COMPLETED: (Colors.GREEN, "✅"),
-        TaskState.FAILED: (Colors.RED, "❌"),
-        TaskState.CANCELED: (Colors.YELLOW, "🚫"),
-        TaskState.INPUT_REQUIRED: (Colors.MAGENTA, "❓"),
-    }
-    
-    color, icon = state_colors.get(state, (Colors.WHITE, "•"))
+    prefix = _STATE_PREFIX.get(state)
+    if prefix is None:
+        prefix = _state_prefix(state, *_DEFAULT_STYLE)
     
     # Extract message text
-    msg_text = ""
-    if event.status.message and event.status.message.parts:
-        for part in event.status.message.parts:
-            if hasattr(part, "text"):
-                msg_text = part.text
-                break
+    message = event.status.message
+    msg_text = _first_text(message.parts) if message else ""
     
-    return f"{Colors.DIM}[{timestamp}]{Colors.RESET} {icon} {color}{state.value.upper()}{Colors.RESET}: {msg_text}"
+    return b"".join((_TS_PREFIX, _timestamp(), _TS_SUFFIX, prefix, _encode(msg_text), b"\n\n"))
 
 
-def format_artifact_event(event: TaskArtifactUpdateEvent) -> str:
-    """Format an artifact update event for display."""
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-    
+def format_artifact_event(event: TaskArtifactUpdateEvent) -> bytes:
+    """Format an artifact update event for display, including its blank separator line."""
     name = event.artifact.name or "artifact"
     
     # Extract content preview
-    content = ""
-    for part in event.artifact.parts:
-        if hasattr(part, "text"):
-            content = part.text[:200]
-            if len(part.text) > 200:
-                content += "..."
-            break
+    content = _format_preview(_first_text(event.artifact.parts))
     
-    return f"""{Colors.DIM}[{timestamp}]{Colors.RESET} 📦 {Colors.CYAN}ARTIFACT{Colors.RESET}: {name}
-{Colors.DIM}└─{Colors.RESET} {content}"""
+    return b"".join((
+        _TS_PREFIX, _timestamp(), _TS_SUFFIX,
+        _ARTIFACT_PREFIX, _encode(name),
+        _ARTIFACT_BODY_PREFIX, _encode(content), b"\n\n",
+    ))
+
+
+# Event type -> formatter, looked up by exact type for each streamed event
+_FORMATTERS = {
+    TaskStatusUpdateEvent: format_status_event,
+    TaskArtifactUpdateEvent: format_artifact_event,
+}
+
+# Terminal output is drawn at most once per frame (60 Hz); bursts of
+# events arriving within a frame are written together.
+_FRAME_INTERVAL = 1 / 60
+_END_OF_STREAM = object()
+
+
+async def _write_frames(queue: asyncio.Queue) -> None:
+    """Drain formatted output from ``queue`` to stdout, one write per frame."""
+    while True:
+        first = await queue.get()
+        if first is _END_OF_STREAM:
+            return
+        await asyncio.sleep(_FRAME_INTERVAL)
+        
+        batch = [first]
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        done = batch[-1] is _END_OF_STREAM
+        if done:
+            batch.pop()
+        
+        _write_bytes(b"".join(batch))
+        sys.stdout.flush()
+        if done:
+            return
 
 
 async def send_request(
     client: A2AClient,
     message_text: str,
+    label: Optional[str] = None,
 ) -> None:
-    """Send a request and display streaming updates."""
-    print(f"\n{Colors.BOLD}Sending request:{Colors.RESET} {message_text}")
+    """
+    Send a request and display streaming updates.
+    
+    When ``label`` is given, every event is tagged with it so several
+    requests can stream to the terminal concurrently.
+    """
+    # NOTE: do not `break` out of the send_subscribe loop on a terminal
+    # state. Letting the generator finish drains the SSE response to EOF,
+    # which keeps the keep-alive connection reusable for the next request.
+    label_text = f"{Colors.BOLD}{Colors.BG_BLUE} {label} {Colors.RESET} " if label else ""
+    prefix = _encode(label_text)
+    print(f"\n{label_text}{Colors.BOLD}Sending request:{Colors.RESET} {message_text}")
     print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}\n")
     
     message = Message(
@@ -151,42 +318,60 @@ async def send_request(
         parts=[TextPart(text=message_text)],
     )
     
+    queue: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(_write_frames(queue))
+    
     try:
         async for event in client.send_subscribe(message):
-            if isinstance(event, TaskStatusUpdateEvent):
-                print(format_status_event(event))
-            elif isinstance(event, TaskArtifactUpdateEvent):
-                print(format_artifact_event(event))
-            print()  # Blank line between events
+            fmt = _FORMATTERS.get(type(event))
+            if fmt is not None:
+                queue.put_nowait(prefix + fmt(event))
             
     except Exception as e:
-        print(f"{Colors.RED}Error: {str(e)}{Colors.RESET}")
+        queue.put_nowait(prefix + _encode(f"{Colors.RED}Error: {str(e)}{Colors.RESET}\n"))
+    finally:
+        queue.put_nowait(_END_OF_STREAM)
+        await writer
 
 
-async def interactive_mode(client: A2AClient):
-    """Run interactive demo mode."""
-    print_header()
-    print_flow_diagram()
+async def _ainput(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
     
-    print(f"""
-{Colors.BOLD}Sample requests to try:{Colors.RESET}
-{Colors.GREEN}Booking:{Colors.RESET}
-  • "I'd like to book an appointment for next Monday at 2pm"
-  • "Check availability for December 20th"
-  • "Cancel my booking BK1001"
+    The read runs on a daemon thread (not the default executor) so a
+    pending input() never holds up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result: Optional[str], error: Optional[Exception]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except Exception as e:  # EOFError on closed stdin
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, line, None)
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
 
-{Colors.GREEN}Billing:{Colors.RESET}
-  • "Show me my pending invoices"
-  • "I need to pay invoice INV5002"
-  • "Request a refund for INV5001"
 
-{Colors.DIM}Type 'quit' or 'exit' to stop, 'clear' to clear screen{Colors.RESET}
-""")
+async def interactive_mode(client: A2AClient):
+    """Run interactive demo mode."""
+    _write_bytes(_HEADER + _FLOW + _SAMPLES)
     
     while True:
         try:
             print(f"\n{Colors.BOLD}{Colors.CYAN}Enter your request:{Colors.RESET}")
-            user_input = input("> ").strip()
+            user_input = (await _ainput("> ")).strip()
             
             if not user_input:
                 continue
@@ -202,17 +387,16 @@ async def interactive_mode(client: A2AClient):
                 
             await send_request(client, user_input)
             
-        except KeyboardInterrupt:
-            print(f"\n{Colors.GREEN}Goodbye!{Colors.RESET}")
-            break
         except EOFError:
             break
 
 
-async def demo_mode(client: A2AClient):
+async def demo_mode(client: A2AClient, quiet: bool = False):
     """Run automated demo with sample requests."""
-    print_header()
-    print_flow_diagram()
+    # The banners are decorative; skip them when output is captured.
+    if not quiet and sys.stdout.isatty():
+        print_header()
+        print_flow_diagram()
     
     demo_requests = [
         ("Booking Request", "I'd like to book an appointment for December 20th at 2pm for a consultation"),
@@ -220,11 +404,13 @@ async def demo_mode(client: A2AClient):
         ("General Request", "What services do you offer?"),
     ]
     
-    for title, request in demo_requests:
-        print(f"\n{Colors.BOLD}{Colors.BG_BLUE} {title} {Colors.RESET}")
-        await send_request(client, request)
-        print(f"\n{Colors.DIM}{'═' * 60}{Colors.RESET}")
-        await asyncio.sleep(2)  # Pause between demos
+    # The requests are independent, so stream them concurrently; each
+    # event is labelled with its request title to keep output readable.
+    await asyncio.gather(*(
+        send_request(client, request, label=title)
+        for title, request in demo_requests
+    ))
+    print(f"\n{Colors.DIM}{'═' * 60}{Colors.RESET}")
 
 
 async def main():
@@ -243,10 +429,19 @@ async def main():
         action="store_true",
         help="Run automated demo instead of interactive mode",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Skip the header and flow diagram in demo mode",
+    )
     args = parser.parse_args()
     
     load_dotenv()
     
+    # Buffer stdout fully; send_request flushes once per streamed event
+    # instead of paying a write() per print() call.
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     async with A2AClient(args.url) as client:
         # Verify connection
         try:
@@ -265,13 +460,21 @@ async def main():
             return
         
         if args.demo:
-            await demo_mode(client)
+            await demo_mode(client, quiet=args.quiet)
         else:
             await interactive_mode(client)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
-
-
+    try:
+        import uvloop  # installed with uvicorn[standard] on POSIX
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    try:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
+    except KeyboardInterrupt:
+        # Ctrl-C now cancels the main task instead of interrupting input()
+        print(f"\n{Colors.GREEN}Goodbye!{Colors.RESET}")
@@ -0,0 +1,241 @@
+const streamContainer = document.getElementById('streamContainer');
+const messageInput = document.getElementById('messageInput');
+const sendBtn = document.getElementById('sendBtn');
+const clearBtn = document.getElementById('clearBtn');
+const eventCountEl = document.getElementById('eventCount');
+const responseTimeEl = document.getElementById('responseTime');
+const eventTemplate = document.getElementById('eventTemplate').content.firstElementChild;
+const emptyStateEl = streamContainer.querySelector('.empty-state').cloneNode(true);
+
+// Flow diagram nodes, looked up once instead of on every event
+const FLOW = {
+    intent: document.getElementById('flowIntent'),
+    booking: document.getElementById('flowBooking'),
+    billing: document.getElementById('flowBilling'),
+    connector1: document.getElementById('flowConnector1'),
+    connector2: document.getElementById('flowConnector2'),
+    intentStatus: document.getElementById('intentStatus'),
+    bookingStatus: document.getElementById('bookingStatus'),
+    billingStatus: document.getElementById('billingStatus'),
+};
+
+let eventCount = 0;
+let startTime = null;
+
+// Built once: toLocaleTimeString would construct a new formatter per event
+const TIMESTAMP_FORMAT = new Intl.DateTimeFormat('en-US', {
+    hour12: false,
+    hour: '2-digit',
+    minute: '2-digit',
+    second: '2-digit',
+    fractionalSecondDigits: 3
+});
+
+// The WebSocket lives in a worker, which decodes frames off the main
+// thread and posts each frame's events here
+const wsWorker = new Worker(document.currentScript.dataset.wsWorker);
+wsWorker.onmessage = (event) => {
+    event.data.forEach(handleEvent);
+};
+
+// Events rendered since the last animation frame
+let pendingEvents = document.createDocumentFragment();
+let flushScheduled = false;
+
+function flushEvents() {
+    flushScheduled = false;
+
+    // Remove empty state
+    const emptyState = streamContainer.querySelector('.empty-state');
+    if (emptyState) emptyState.remove();
+
+    // Appending the fragment moves its nodes and leaves it empty for reuse
+    streamContainer.appendChild(pendingEvents);
+    streamContainer.scrollTop = streamContainer.scrollHeight;
+}
+
+// Once the stream holds this many events the oldest node is reused, so
+// long sessions keep a fixed DOM size
+const MAX_EVENTS = 200;
+
+function takeEventNode() {
+    if (streamContainer.childElementCount + pendingEvents.childElementCount >= MAX_EVENTS) {
+        // A burst bigger than the cap can leave only pending nodes to reuse
+        const oldest = streamContainer.firstElementChild;
+        const source = oldest && oldest.classList.contains('event-item')
+            ? streamContainer
+            : pendingEvents;
+        if (source.firstElementChild) return source.firstElementChild;
+    }
+    return eventTemplate.cloneNode(true);
+}
+
+// Fill in a fresh or recycled event node with textContent only, so the
+// HTML parser never runs (and agent text can't inject markup)
+function renderEvent(kind, icon, label, timestamp, bodyClass, body) {
+    const eventEl = takeEventNode();
+    const [iconEl, stateEl, timestampEl] = eventEl.firstElementChild.children;
+    const bodyEl = eventEl.lastElementChild;
+
+    iconEl.className = `event-icon ${kind}`;
+    iconEl.textContent = icon;
+    stateEl.className = `event-state ${kind}`;
+    stateEl.textContent = label;
+    timestampEl.textContent = timestamp;
+    bodyEl.className = bodyClass;
+    bodyEl.textContent = body;
+    return eventEl;
+}
+
+// Handle incoming events
+function handleEvent(data) {
+    eventCount++;
+    eventCountEl.textContent = eventCount;
+
+    const timestamp = TIMESTAMP_FORMAT.format(new Date());
+
+    if (data.type === 'status') {
+        const state = data.status.state;
+        const message = data.status.message?.parts?.[0]?.text || state;
+
+        pendingEvents.appendChild(
+            renderEvent(state, getStateIcon(state), state, timestamp, 'event-message', message)
+        );
+
+        // Update flow diagram
+        updateFlowDiagram(state, message);
+
+        // Update response time on completion
+        if (state === 'completed' || state === 'failed') {
+            if (startTime) {
+                const elapsed = ((Date.now() - startTime) / 1000).toFixed(2);
+                responseTimeEl.textContent = `${elapsed}s`;
+            }
+            sendBtn.disabled = false;
+        }
+    } else if (data.type === 'artifact') {
+        const name = data.artifact.name || 'Result';
+        const content = data.artifact.parts?.[0]?.text || '';
+
+        pendingEvents.appendChild(
+            renderEvent('artifact', '📦', name, timestamp, 'artifact-content', formatArtifactContent(content))
+        );
+    }
+
+    // Insert everything that arrived this frame in one DOM update
+    if (!flushScheduled) {
+        flushScheduled = true;
+        requestAnimationFrame(flushEvents);
+    }
+}
+
+function getStateIcon(state) {
+    const icons = {
+        'submitted': '📤',
+        'working': '⚙️',
+        'completed': '✅',
+        'failed': '❌',
+        'canceled': '🚫',
+        'input-required': '❓'
+    };
+    return icons[state] || '•';
+}
+
+function formatArtifactContent(content) {
+    try {
+        const parsed = JSON.parse(content);
+        return JSON.stringify(parsed, null, 2);
+    } catch {
+        return content;
+    }
+}
+
+function updateFlowDiagram(state, message) {
+    const { intent, booking, billing, connector1, connector2 } = FLOW;
+
+    // Reset
+    intent.classList.remove('active', 'complete');
+    booking.classList.remove('active', 'complete');
+    billing.classList.remove('active', 'complete');
+    connector1.classList.remove('active');
+    connector2.classList.remove('active');
+
+    // Detect active agent from message
+    const msgLower = message.toLowerCase();
+
+    if (msgLower.includes('booking')) {
+        intent.classList.add('complete');
+        connector1.classList.add('active');
+        booking.classList.add('active');
+        booking.style.opacity = '1';
+        FLOW.bookingStatus.textContent = state;
+        FLOW.intentStatus.textContent = 'Done';
+    } else if (msgLower.includes('billing')) {
+        intent.classList.add('complete');
+        connector2.classList.add('active');
+        billing.classList.add('active');
+        billing.style.opacity = '1';
+        FLOW.billingStatus.textContent = state;
+        FLOW.intentStatus.textContent = 'Done';
+    } else {
+        intent.classList.add('active');
+        FLOW.intentStatus.textContent = state;
+    }
+
+    if (state === 'completed') {
+        intent.classList.remove('active');
+        intent.classList.add('complete');
+        booking.classList.remove('active');
+        booking.classList.add('complete');
+        billing.classList.remove('active');
+        billing.classList.add('complete');
+    }
+}
+
+// Send message
+async function sendMessage() {
+    const message = messageInput.value.trim();
+    if (!message) return;
+
+    sendBtn.disabled = true;
+    startTime = Date.now();
+    eventCount = 0;
+    eventCountEl.textContent = '0';
+    responseTimeEl.textContent = '—';
+
+    // Reset flow
+    FLOW.intentStatus.textContent = 'Processing...';
+    FLOW.bookingStatus.textContent = '—';
+    FLOW.billingStatus.textContent = '—';
+    FLOW.booking.style.opacity = '0.5';
+    FLOW.billing.style.opacity = '0.5';
+
+    // Sent by the worker as a binary frame
+    wsWorker.postMessage({ message });
+    messageInput.value = '';
+    messageInput.focus();
+}
+
+// Event listeners
+sendBtn.addEventListener('click', sendMessage);
+messageInput.addEventListener('keypress', (e) => {
+    if (e.key === 'Enter') sendMessage();
+});
+
+clearBtn.addEventListener('click', () => {
+    pendingEvents.replaceChildren();
+    streamContainer.replaceChildren(emptyStateEl.cloneNode(true));
+    eventCount = 0;
+    eventCountEl.textContent = '0';
+});
+
+// Suggestion chips
+document.querySelectorAll('.suggestion-chip').forEach(chip => {
+    chip.addEventListener('click', () => {
+        messageInput.value = chip.dataset.msg;
+        messageInput.focus();
+    });
+});
+
+// Initialize
+messageInput.focus();
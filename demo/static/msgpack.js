@@ -0,0 +1,177 @@
+// Minimal MessagePack codec for the demo's WebSocket frames, served from
+// the same origin as the worker that loads it. Covers the types the
+// server's msgpack Packer emits (nil, bool, int, float, str, bin, array,
+// map) and exposes the same encode/decode API as @msgpack/msgpack.
+
+(function (global) {
+    'use strict';
+
+    const textDecoder = new TextDecoder();
+    const textEncoder = new TextEncoder();
+
+    function decode(bytes) {
+        const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        let pos = 0;
+
+        function str(length) {
+            const value = textDecoder.decode(bytes.subarray(pos, pos + length));
+            pos += length;
+            return value;
+        }
+
+        function bin(length) {
+            const value = bytes.slice(pos, pos + length);
+            pos += length;
+            return value;
+        }
+
+        function array(length) {
+            const value = new Array(length);
+            for (let i = 0; i < length; i++) value[i] = read();
+            return value;
+        }
+
+        function map(length) {
+            const value = {};
+            for (let i = 0; i < length; i++) {
+                const key = read();
+                value[key] = read();
+            }
+            return value;
+        }
+
+        function read() {
+            const type = view.getUint8(pos++);
+            let value;
+
+            if (type <= 0x7f) return type;
+            if (type >= 0xe0) return type - 0x100;
+            if (type <= 0x8f) return map(type & 0x0f);
+            if (type <= 0x9f) return array(type & 0x0f);
+            if (type <= 0xbf) return str(type & 0x1f);
+
+            switch (type) {
+                case 0xc0: return null;
+                case 0xc2: return false;
+                case 0xc3: return true;
+                case 0xc4: value = view.getUint8(pos); pos += 1; return bin(value);
+                case 0xc5: value = view.getUint16(pos); pos += 2; return bin(value);
+                case 0xc6: value = view.getUint32(pos); pos += 4; return bin(value);
+                case 0xca: value = view.getFloat32(pos); pos += 4; return value;
+                case 0xcb: value = view.getFloat64(pos); pos += 8; return value;
+                case 0xcc: value = view.getUint8(pos); pos += 1; return value;
+                case 0xcd: value = view.getUint16(pos); pos += 2; return value;
+                case 0xce: value = view.getUint32(pos); pos += 4; return value;
+                case 0xcf: value = Number(view.getBigUint64(pos)); pos += 8; return value;
+                case 0xd0: value = view.getInt8(pos); pos += 1; return value;
+                case 0xd1: value = view.getInt16(pos); pos += 2; return value;
+                case 0xd2: value = view.getInt32(pos); pos += 4; return value;
+                case 0xd3: value = Number(view.getBigInt64(pos)); pos += 8; return value;
+                case 0xd9: value = view.getUint8(pos); pos += 1; return str(value);
+                case 0xda: value = view.getUint16(pos); pos += 2; return str(value);
+                case 0xdb: value = view.getUint32(pos); pos += 4; return str(value);
+                case 0xdc: value = view.getUint16(pos); pos += 2; return array(value);
+                case 0xdd: value = view.getUint32(pos); pos += 4; return array(value);
+                case 0xde: value = view.getUint16(pos); pos += 2; return map(value);
+                case 0xdf: value = view.getUint32(pos); pos += 4; return map(value);
+            }
+            throw new Error(`Unsupported MessagePack type 0x${type.toString(16)}`);
+        }
+
+        return read();
+    }
+
+    function encode(value) {
+        let bytes = new Uint8Array(256);
+        let view = new DataView(bytes.buffer);
+        let pos = 0;
+
+        function reserve(size) {
+            if (pos + size <= bytes.length) return;
+            const grown = new Uint8Array(Math.max(bytes.length * 2, pos + size));
+            grown.set(bytes);
+            bytes = grown;
+            view = new DataView(bytes.buffer);
+        }
+
+        function header(size, fix, fixMax, codes) {
+            // codes: [8-bit, 16-bit, 32-bit] type bytes (8-bit may be null)
+            if (size <= fixMax) {
+                reserve(1);
+                bytes[pos++] = fix | size;
+            } else if (codes[0] !== null && size <= 0xff) {
+                reserve(2);
+                bytes[pos++] = codes[0];
+                bytes[pos++] = size;
+            } else if (size <= 0xffff) {
+                reserve(3);
+                bytes[pos++] = codes[1];
+                view.setUint16(pos, size);
+                pos += 2;
+            } else {
+                reserve(5);
+                bytes[pos++] = codes[2];
+                view.setUint32(pos, size);
+                pos += 4;
+            }
+        }
+
+        function raw(data) {
+            reserve(data.length);
+            bytes.set(data, pos);
+            pos += data.length;
+        }
+
+        function write(value) {
+            if (value === null || value === undefined) {
+                reserve(1);
+                bytes[pos++] = 0xc0;
+            } else if (typeof value === 'boolean') {
+                reserve(1);
+                bytes[pos++] = value ? 0xc3 : 0xc2;
+            } else if (typeof value === 'number') {
+                reserve(9);
+                if (Number.isInteger(value) && value >= -0x20 && value <= 0x7f) {
+                    view.setInt8(pos++, value);
+                } else if (Number.isInteger(value) && value >= -0x80000000 && value <= 0xffffffff) {
+                    if (value >= 0) {
+                        bytes[pos++] = 0xce;
+                        view.setUint32(pos, value);
+                    } else {
+                        bytes[pos++] = 0xd2;
+                        view.setInt32(pos, value);
+                    }
+                    pos += 4;
+                } else {
+                    bytes[pos++] = 0xcb;
+                    view.setFloat64(pos, value);
+                    pos += 8;
+                }
+            } else if (typeof value === 'string') {
+                const data = textEncoder.encode(value);
+                header(data.length, 0xa0, 0x1f, [0xd9, 0xda, 0xdb]);
+                raw(data);
+            } else if (value instanceof Uint8Array) {
+                header(value.length, 0xc4, -1, [0xc4, 0xc5, 0xc6]);
+                raw(value);
+            } else if (Array.isArray(value)) {
+                header(value.length, 0x90, 0x0f, [null, 0xdc, 0xdd]);
+                for (const item of value) write(item);
+            } else if (typeof value === 'object') {
+                const keys = Object.keys(value).filter((key) => value[key] !== undefined);
+                header(keys.length, 0x80, 0x0f, [null, 0xde, 0xdf]);
+                for (const key of keys) {
+                    write(key);
+                    write(value[key]);
+                }
+            } else {
+                throw new Error(`Cannot encode ${typeof value} as MessagePack`);
+            }
+        }
+
+        write(value);
+        return bytes.subarray(0, pos);
+    }
+
+    global.MessagePack = { encode, decode };
+})(self);
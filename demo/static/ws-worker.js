@@ -0,0 +1,54 @@
+// Owns the demo WebSocket so frame decoding runs off the page's main
+// thread. Posts each frame's events to the page as an array, and sends
+// whatever payload the page posts back.
+
+// The page passes the versioned URL of the same-origin msgpack codec
+const msgpackUrl = new URLSearchParams(self.location.search).get('msgpack');
+try {
+    if (msgpackUrl) importScripts(msgpackUrl);
+} catch {
+    // Without msgpack we stay on JSON
+}
+
+const MessagePack = self.MessagePack || null;
+const decoder = new TextDecoder();
+const encoder = new TextEncoder();
+
+let ws = null;
+
+function decodeFrame(data) {
+    if (typeof data === 'string') return JSON.parse(data);
+    if (ws.protocol === 'msgpack') return MessagePack.decode(new Uint8Array(data));
+    return JSON.parse(decoder.decode(data));
+}
+
+function encodeFrame(payload) {
+    if (ws.protocol === 'msgpack') return MessagePack.encode(payload);
+    return encoder.encode(JSON.stringify(payload));
+}
+
+// WebSocket connection
+function connect() {
+    const url = `ws://${self.location.host}/ws`;
+    // The server falls back to JSON when it can't speak msgpack
+    ws = MessagePack ? new WebSocket(url, ['msgpack']) : new WebSocket(url);
+    ws.binaryType = 'arraybuffer';
+
+    ws.onmessage = (event) => {
+        const data = decodeFrame(event.data);
+        postMessage(data.type === 'batch' ? data.events : [data]);
+    };
+
+    ws.onclose = () => {
+        setTimeout(connect, 1000);
+    };
+}
+
+// Messages from the page go out as binary frames
+self.onmessage = (event) => {
+    if (ws && ws.readyState === WebSocket.OPEN) {
+        ws.send(encodeFrame(event.data));
+    }
+};
+
+connect();
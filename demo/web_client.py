@@ -6,17 +6,51 @@ flow with real-time visualization.
 """
 
 import asyncio
-import json
+import gzip
+import hashlib
+import html
 import os
 import sys
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi import Depends, FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
+import httpx
 import uvicorn
 from dotenv import load_dotenv
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Encode protocol models (TaskStatus, Artifact, ...) handed over as-is."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not serializable: {type(obj).__name__}")
+
+
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=_default)
+except ImportError:  # pragma: no cover
+    import json
+    
+    _loads = json.loads
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode()
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
 
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -25,6 +59,7 @@ from common.a2a_client import A2AClient
 from common.a2a_protocol import (
     Message,
     TextPart,
+    TaskState,
     TaskStatusUpdateEvent,
     TaskArtifactUpdateEvent,
 )
@@ -32,13 +67,63 @@ from common.a2a_protocol import (
 
 load_dotenv()
 
-app = FastAPI(title="A2A Customer Service Demo")
-
 # Intent Agent URL
 INTENT_AGENT_URL = os.getenv("INTENT_AGENT_URL", "http://localhost:8001")
 
 
-# HTML template with embedded CSS and JS
+# Keep-alive pool shared by every WebSocket session
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=100)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: one warm httpx pool, wrapped by the A2A client every
+    # WebSocket session uses instead of a fresh one per message
+    async with httpx.AsyncClient(timeout=httpx.Timeout(60.0), limits=HTTP_LIMITS) as http:
+        app.state.a2a_client = A2AClient(INTENT_AGENT_URL, http_client=http)
+        yield
+    # Shutdown: the context manager closed the pool
+
+
+app = FastAPI(title="A2A Customer Service Demo", lifespan=lifespan)
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep assets for a year.
+    
+    Safe because the page links every asset with a content hash in its
+    query string, so a changed file gets a new URL.
+    """
+    
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+def _static_url(name: str) -> str:
+    """Build a cache-busting URL for a file in STATIC_DIR."""
+    with open(os.path.join(STATIC_DIR, name), "rb") as f:
+        version = hashlib.md5(f.read()).hexdigest()[:12]
+    return f"/static/{name}?v={version}"
+
+
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
+APP_CSS_URL = _static_url("app.css")
+APP_JS_URL = _static_url("app.js")
+# The worker loads the msgpack codec from the URL in its own query string,
+# so a new codec version also changes the worker's URL
+WS_WORKER_URL = (
+    _static_url("ws-worker.js") + "&msgpack=" + quote(_static_url("msgpack.js"), safe="")
+)
+
+# HTML shell; styles and behaviour live in static/app.css and static/app.js,
+# and the WebSocket itself in static/ws-worker.js
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -49,451 +134,8 @@ HTML_TEMPLATE = """
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600&family=Outfit:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {
-            --bg-primary: #0a0e14;
-            --bg-secondary: #0d1117;
-            --bg-card: #161b22;
-            --bg-card-hover: #1c2128;
-            --border-color: #30363d;
-            --text-primary: #e6edf3;
-            --text-secondary: #8b949e;
-            --text-muted: #6e7681;
-            
-            --accent-blue: #58a6ff;
-            --accent-green: #3fb950;
-            --accent-yellow: #d29922;
-            --accent-red: #f85149;
-            --accent-purple: #a371f7;
-            --accent-cyan: #39d0d0;
-            
-            --gradient-primary: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            --gradient-success: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-            --gradient-working: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Outfit', -apple-system, BlinkMacSystemFont, sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            min-height: 100vh;
-            overflow-x: hidden;
-        }
-        
-        /* Background pattern */
-        body::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: 
-                radial-gradient(ellipse at 20% 20%, rgba(88, 166, 255, 0.08) 0%, transparent 50%),
-                radial-gradient(ellipse at 80% 80%, rgba(163, 113, 247, 0.08) 0%, transparent 50%),
-                radial-gradient(ellipse at 50% 50%, rgba(57, 208, 208, 0.03) 0%, transparent 70%);
-            pointer-events: none;
-            z-index: 0;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 24px;
-            position: relative;
-            z-index: 1;
-        }
-        
-        /* Header */
-        .header {
-            text-align: center;
-            padding: 40px 0;
-            margin-bottom: 32px;
-        }
-        
-        .header h1 {
-            font-size: 2.5rem;
-            font-weight: 700;
-            background: var(--gradient-primary);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 12px;
-        }
-        
-        .header p {
-            color: var(--text-secondary);
-            font-size: 1.1rem;
-            max-width: 600px;
-            margin: 0 auto;
-        }
-        
-        .badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-            padding: 6px 12px;
-            background: var(--bg-card);
-            border: 1px solid var(--border-color);
-            border-radius: 20px;
-            font-size: 0.85rem;
-            color: var(--text-secondary);
-            margin-top: 16px;
-        }
-        
-        .badge .dot {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            background: var(--accent-green);
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-        
-        /* Main layout */
-        .main-grid {
-            display: grid;
-            grid-template-columns: 1fr 350px;
-            gap: 24px;
-        }
-        
-        @media (max-width: 1024px) {
-            .main-grid {
-                grid-template-columns: 1fr;
-            }
-        }
-        
-        /* Cards */
-        .card {
-            background: var(--bg-card);
-            border: 1px solid var(--border-color);
-            border-radius: 16px;
-            overflow: hidden;
-        }
-        
-        .card-header {
-            padding: 16px 20px;
-            border-bottom: 1px solid var(--border-color);
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }
-        
-        .card-title {
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: var(--text-primary);
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        
-        .card-body {
-            padding: 20px;
-        }
-        
-        /* Input section */
-        .input-section {
-            margin-bottom: 24px;
-        }
-        
-        .input-wrapper {
-            position: relative;
-        }
-        
-        .message-input {
-            width: 100%;
-            padding: 16px 120px 16px 20px;
-            background: var(--bg-secondary);
-            border: 2px solid var(--border-color);
-            border-radius: 12px;
-            color: var(--text-primary);
-            font-family: inherit;
-            font-size: 1rem;
-            transition: all 0.2s;
-        }
-        
-        .message-input:focus {
-            outline: none;
-            border-color: var(--accent-blue);
-            box-shadow: 0 0 0 4px rgba(88, 166, 255, 0.1);
-        }
-        
-        .message-input::placeholder {
-            color: var(--text-muted);
-        }
-        
-        .send-btn {
-            position: absolute;
-            right: 8px;
-            top: 50%;
-            transform: translateY(-50%);
-            padding: 10px 20px;
-            background: var(--gradient-primary);
-            border: none;
-            border-radius: 8px;
-            color: white;
-            font-family: inherit;
-            font-weight: 600;
-            font-size: 0.9rem;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .send-btn:hover {
-            transform: translateY(-50%) scale(1.02);
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
-        }
-        
-        .send-btn:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-            transform: translateY(-50%);
-        }
-        
-        /* Suggestions */
-        .suggestions {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-            margin-top: 12px;
-        }
-        
-        .suggestion-chip {
-            padding: 8px 14px;
-            background: var(--bg-secondary);
-            border: 1px solid var(--border-color);
-            border-radius: 20px;
-            color: var(--text-secondary);
-            font-size: 0.85rem;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .suggestion-chip:hover {
-            background: var(--bg-card-hover);
-            border-color: var(--accent-blue);
-            color: var(--text-primary);
-        }
-        
-        /* Status stream */
-        .stream-container {
-            height: 500px;
-            overflow-y: auto;
-            padding-right: 8px;
-        }
-        
-        .stream-container::-webkit-scrollbar {
-            width: 6px;
-        }
-        
-        .stream-container::-webkit-scrollbar-track {
-            background: transparent;
-        }
-        
-        .stream-container::-webkit-scrollbar-thumb {
-            background: var(--border-color);
-            border-radius: 3px;
-        }
-        
-        .event-item {
-            padding: 16px;
-            margin-bottom: 12px;
-            background: var(--bg-secondary);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            animation: slideIn 0.3s ease;
-        }
-        
-        @keyframes slideIn {
-            from {
-                opacity: 0;
-                transform: translateY(10px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-        
-        .event-header {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin-bottom: 8px;
-        }
-        
-        .event-icon {
-            width: 32px;
-            height: 32px;
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1rem;
-        }
-        
-        .event-icon.submitted { background: rgba(210, 153, 34, 0.2); }
-        .event-icon.working { background: rgba(88, 166, 255, 0.2); }
-        .event-icon.completed { background: rgba(63, 185, 80, 0.2); }
-        .event-icon.failed { background: rgba(248, 81, 73, 0.2); }
-        .event-icon.artifact { background: rgba(57, 208, 208, 0.2); }
-        
-        .event-state {
-            font-weight: 600;
-            font-size: 0.85rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .event-state.submitted { color: var(--accent-yellow); }
-        .event-state.working { color: var(--accent-blue); }
-        .event-state.completed { color: var(--accent-green); }
-        .event-state.failed { color: var(--accent-red); }
-        .event-state.artifact { color: var(--accent-cyan); }
-        
-        .event-timestamp {
-            margin-left: auto;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.75rem;
-            color: var(--text-muted);
-        }
-        
-        .event-message {
-            color: var(--text-secondary);
-            font-size: 0.95rem;
-            line-height: 1.5;
-        }
-        
-        .artifact-content {
-            margin-top: 12px;
-            padding: 12px;
-            background: var(--bg-primary);
-            border-radius: 8px;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.8rem;
-            color: var(--text-secondary);
-            white-space: pre-wrap;
-            word-break: break-word;
-            max-height: 200px;
-            overflow-y: auto;
-        }
-        
-        .empty-state {
-            text-align: center;
-            padding: 60px 20px;
-            color: var(--text-muted);
-        }
-        
-        .empty-state svg {
-            width: 64px;
-            height: 64px;
-            margin-bottom: 16px;
-            opacity: 0.5;
-        }
-        
-        /* Flow diagram */
-        .flow-diagram {
-            padding: 20px;
-        }
-        
-        .flow-node {
-            padding: 12px 16px;
-            background: var(--bg-secondary);
-            border: 1px solid var(--border-color);
-            border-radius: 10px;
-            margin-bottom: 8px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            transition: all 0.3s;
-        }
-        
-        .flow-node.active {
-            border-color: var(--accent-blue);
-            box-shadow: 0 0 0 4px rgba(88, 166, 255, 0.1);
-        }
-        
-        .flow-node.complete {
-            border-color: var(--accent-green);
-        }
-        
-        .flow-node-icon {
-            width: 36px;
-            height: 36px;
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.1rem;
-        }
-        
-        .flow-node-icon.intent { background: rgba(163, 113, 247, 0.2); }
-        .flow-node-icon.booking { background: rgba(63, 185, 80, 0.2); }
-        .flow-node-icon.billing { background: rgba(88, 166, 255, 0.2); }
-        
-        .flow-node-label {
-            font-weight: 500;
-            font-size: 0.9rem;
-        }
-        
-        .flow-node-status {
-            margin-left: auto;
-            font-size: 0.75rem;
-            color: var(--text-muted);
-        }
-        
-        .flow-connector {
-            width: 2px;
-            height: 20px;
-            background: var(--border-color);
-            margin-left: 28px;
-        }
-        
-        .flow-connector.active {
-            background: var(--accent-blue);
-        }
-        
-        /* Metrics */
-        .metrics {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 12px;
-            margin-top: 20px;
-        }
-        
-        .metric-card {
-            padding: 16px;
-            background: var(--bg-secondary);
-            border-radius: 10px;
-            text-align: center;
-        }
-        
-        .metric-value {
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: var(--text-primary);
-            font-family: 'JetBrains Mono', monospace;
-        }
-        
-        .metric-label {
-            font-size: 0.75rem;
-            color: var(--text-muted);
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-top: 4px;
-        }
-    </style>
+    <link rel="stylesheet" href="{app_css}">
+    <script defer src="{app_js}" data-ws-worker="{ws_worker}"></script>
 </head>
 <body>
     <div class="container">
@@ -597,289 +239,411 @@ HTML_TEMPLATE = """
         </div>
     </div>
     
-    <script>
-        const streamContainer = document.getElementById('streamContainer');
-        const messageInput = document.getElementById('messageInput');
-        const sendBtn = document.getElementById('sendBtn');
-        const clearBtn = document.getElementById('clearBtn');
-        const eventCountEl = document.getElementById('eventCount');
-        const responseTimeEl = document.getElementById('responseTime');
-        
-        let ws = null;
-        let eventCount = 0;
-        let startTime = null;
-        
-        // WebSocket connection
-        function connect() {
-            ws = new WebSocket(`ws://${window.location.host}/ws`);
-            
-            ws.onmessage = (event) => {
-                const data = JSON.parse(event.data);
-                handleEvent(data);
-            };
-            
-            ws.onclose = () => {
-                setTimeout(connect, 1000);
-            };
-        }
-        
-        // Handle incoming events
-        function handleEvent(data) {
-            eventCount++;
-            eventCountEl.textContent = eventCount;
-            
-            // Remove empty state
-            const emptyState = streamContainer.querySelector('.empty-state');
-            if (emptyState) emptyState.remove();
-            
-            // Create event element
-            const eventEl = document.createElement('div');
-            eventEl.className = 'event-item';
-            
-            const timestamp = new Date().toLocaleTimeString('en-US', { 
-                hour12: false, 
-                hour: '2-digit', 
-                minute: '2-digit',
-                second: '2-digit',
-                fractionalSecondDigits: 3
-            });
-            
-            if (data.type === 'status') {
-                const state = data.status.state;
-                const message = data.status.message?.parts?.[0]?.text || state;
-                
-                eventEl.innerHTML = `
-                    <div class="event-header">
-                        <div class="event-icon ${state}">${getStateIcon(state)}</div>
-                        <span class="event-state ${state}">${state}</span>
-                        <span class="event-timestamp">${timestamp}</span>
-                    </div>
-                    <div class="event-message">${message}</div>
-                `;
-                
-                // Update flow diagram
-                updateFlowDiagram(state, message);
-                
-                // Update response time on completion
-                if (state === 'completed' || state === 'failed') {
-                    if (startTime) {
-                        const elapsed = ((Date.now() - startTime) / 1000).toFixed(2);
-                        responseTimeEl.textContent = `${elapsed}s`;
-                    }
-                    sendBtn.disabled = false;
-                }
-            } else if (data.type === 'artifact') {
-                const name = data.artifact.name || 'Result';
-                const content = data.artifact.parts?.[0]?.text || '';
-                
-                eventEl.innerHTML = `
-                    <div class="event-header">
-                        <div class="event-icon artifact">📦</div>
-                        <span class="event-state artifact">${name}</span>
-                        <span class="event-timestamp">${timestamp}</span>
-                    </div>
-                    <div class="artifact-content">${formatArtifactContent(content)}</div>
-                `;
-            }
-            
-            streamContainer.appendChild(eventEl);
-            streamContainer.scrollTop = streamContainer.scrollHeight;
-        }
-        
-        function getStateIcon(state) {
-            const icons = {
-                'submitted': '📤',
-                'working': '⚙️',
-                'completed': '✅',
-                'failed': '❌',
-                'canceled': '🚫',
-                'input-required': '❓'
-            };
-            return icons[state] || '•';
-        }
-        
-        function formatArtifactContent(content) {
-            try {
-                const parsed = JSON.parse(content);
-                return JSON.stringify(parsed, null, 2);
-            } catch {
-                return content;
-            }
-        }
-        
-        function updateFlowDiagram(state, message) {
-            const intentNode = document.getElementById('flowIntent');
-            const bookingNode = document.getElementById('flowBooking');
-            const billingNode = document.getElementById('flowBilling');
-            const connector1 = document.getElementById('flowConnector1');
-            const connector2 = document.getElementById('flowConnector2');
-            
-            // Reset
-            [intentNode, bookingNode, billingNode].forEach(n => {
-                n.classList.remove('active', 'complete');
-            });
-            [connector1, connector2].forEach(c => c.classList.remove('active'));
-            
-            // Detect active agent from message
-            const msgLower = message.toLowerCase();
-            
-            if (msgLower.includes('booking')) {
-                intentNode.classList.add('complete');
-                connector1.classList.add('active');
-                bookingNode.classList.add('active');
-                bookingNode.style.opacity = '1';
-                document.getElementById('bookingStatus').textContent = state;
-                document.getElementById('intentStatus').textContent = 'Done';
-            } else if (msgLower.includes('billing')) {
-                intentNode.classList.add('complete');
-                connector2.classList.add('active');
-                billingNode.classList.add('active');
-                billingNode.style.opacity = '1';
-                document.getElementById('billingStatus').textContent = state;
-                document.getElementById('intentStatus').textContent = 'Done';
-            } else {
-                intentNode.classList.add('active');
-                document.getElementById('intentStatus').textContent = state;
-            }
-            
-            if (state === 'completed') {
-                intentNode.classList.remove('active');
-                intentNode.classList.add('complete');
-                bookingNode.classList.remove('active');
-                bookingNode.classList.add('complete');
-                billingNode.classList.remove('active');
-                billingNode.classList.add('complete');
-            }
-        }
-        
-        // Send message
-        async function sendMessage() {
-            const message = messageInput.value.trim();
-            if (!message || !ws) return;
-            
-            sendBtn.disabled = true;
-            startTime = Date.now();
-            eventCount = 0;
-            eventCountEl.textContent = '0';
-            responseTimeEl.textContent = '—';
-            
-            // Reset flow
-            document.getElementById('intentStatus').textContent = 'Processing...';
-            document.getElementById('bookingStatus').textContent = '—';
-            document.getElementById('billingStatus').textContent = '—';
-            document.getElementById('flowBooking').style.opacity = '0.5';
-            document.getElementById('flowBilling').style.opacity = '0.5';
-            
-            ws.send(JSON.stringify({ message }));
-            messageInput.value = '';
-            messageInput.focus();
-        }
-        
-        // Event listeners
-        sendBtn.addEventListener('click', sendMessage);
-        messageInput.addEventListener('keypress', (e) => {
-            if (e.key === 'Enter') sendMessage();
-        });
-        
-        clearBtn.addEventListener('click', () => {
-            streamContainer.innerHTML = `
-                <div class="empty-state">
-                    <svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="1.5" d="M8.625 12a.375.375 0 11-.75 0 .375.375 0 01.75 0zm0 0H8.25m4.125 0a.375.375 0 11-.75 0 .375.375 0 01.75 0zm0 0H12m4.125 0a.375.375 0 11-.75 0 .375.375 0 01.75 0zm0 0h-.375M21 12c0 4.556-4.03 8.25-9 8.25a9.764 9.764 0 01-2.555-.337A5.972 5.972 0 015.41 20.97a5.969 5.969 0 01-.474-.065 4.48 4.48 0 00.978-2.025c.09-.457-.133-.901-.467-1.226C3.93 16.178 3 14.189 3 12c0-4.556 4.03-8.25 9-8.25s9 3.694 9 8.25z" />
-                    </svg>
-                    <p>Send a message to see real-time status updates</p>
-                </div>
-            `;
-            eventCount = 0;
-            eventCountEl.textContent = '0';
-        });
-        
-        // Suggestion chips
-        document.querySelectorAll('.suggestion-chip').forEach(chip => {
-            chip.addEventListener('click', () => {
-                messageInput.value = chip.dataset.msg;
-                messageInput.focus();
-            });
-        });
-        
-        // Initialize
-        connect();
-        messageInput.focus();
-    </script>
+    <template id="eventTemplate">
+        <div class="event-item">
+            <div class="event-header">
+                <div class="event-icon"></div>
+                <span class="event-state"></span>
+                <span class="event-timestamp"></span>
+            </div>
+            <div></div>
+        </div>
+    </template>
 </body>
 </html>
 """
 
+def _minify_html(html: str) -> str:
+    """Strip the markup's indentation and blank lines."""
+    lines = (line.strip() for line in html.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+# The page never changes while the server runs, so minify, encode and
+# compress it once at import instead of on every request.
+HTML_BYTES = _minify_html(
+    HTML_TEMPLATE.format(app_css=APP_CSS_URL, app_js=APP_JS_URL, ws_worker=html.escape(WS_WORKER_URL))
+).encode("utf-8")
+HTML_GZIP = gzip.compress(HTML_BYTES, 9)
+HTML_ETAG = f'"{hashlib.md5(HTML_BYTES).hexdigest()}"'
+HTML_GZIP_ETAG = HTML_ETAG[:-1] + '-gzip"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match already names this etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in tags or "*" in tags
+
+
+def _html_response(gzipped: bool, not_modified: bool) -> Response:
+    """Build one of the four fixed responses for the page."""
+    headers = {
+        "Cache-Control": "public, max-age=3600",
+        "ETag": HTML_GZIP_ETAG if gzipped else HTML_ETAG,
+        "Vary": "Accept-Encoding",
+        # Start the stylesheet and font connection before the page is parsed
+        "Link": (
+            f"<{APP_CSS_URL}>; rel=preload; as=style, "
+            "<https://fonts.gstatic.com>; rel=preconnect; crossorigin"
+        ),
+    }
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=HTML_GZIP, media_type="text/html", headers=headers)
+    return Response(content=HTML_BYTES, media_type="text/html", headers=headers)
+
+
+# Responses hold no per-request state, so each variant is built once and
+# returned as-is, keyed by (gzipped, not_modified)
+HTML_RESPONSES = {
+    (gzipped, not_modified): _html_response(gzipped, not_modified)
+    for gzipped in (True, False)
+    for not_modified in (True, False)
+}
+
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """Serve the demo UI."""
-    return HTML_TEMPLATE
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    etag = HTML_GZIP_ETAG if use_gzip else HTML_ETAG
+    return HTML_RESPONSES[use_gzip, _etag_matches(request, etag)]
+
+
+def _batch_frame(events: List[bytes]) -> bytes:
+    """Wrap already-serialized events in a single batch frame."""
+    return b'{"type":"batch","events":[' + b",".join(events) + b"]}"
+
+
+# Stand-in value that marks where a template is split (see _split_template)
+_TEMPLATE_MARKER = "\x00template\x00"
+
+
+def _split_template(
+    dumps: Callable[[Any], bytes],
+    payload: dict,
+) -> Tuple[bytes, bytes]:
+    """Encode payload and split it around its single _TEMPLATE_MARKER value."""
+    prefix, suffix = dumps(payload).split(dumps(_TEMPLATE_MARKER))
+    return prefix, suffix
+
+
+def _empty_status_frames(
+    dumps: Callable[[Any], bytes],
+) -> Dict[Tuple[TaskState, bool], Tuple[bytes, bytes]]:
+    """
+    Pre-encode every message-less status frame, split around the task id.
+    
+    Most status events carry no message, so they are sent as prefix +
+    encoded id + suffix instead of building and encoding a payload dict.
+    """
+    return {
+        (state, final): _split_template(
+            dumps,
+            {
+                "type": "status",
+                "id": _TEMPLATE_MARKER,
+                "status": {"state": state.value, "message": None},
+                "final": final,
+            },
+        )
+        for state in TaskState
+        for final in (False, True)
+    }
+
+
+def _failed_status(text: str) -> dict:
+    """Terminal status payload used to report an error to the page."""
+    return {
+        "type": "status",
+        "status": {
+            "state": "failed",
+            "message": {"parts": [{"text": text}]},
+        },
+        "final": True,
+    }
+
+
+class WireCodec(NamedTuple):
+    """How frames are encoded for one WebSocket subprotocol."""
+    
+    subprotocol: Optional[str]
+    loads: Callable[[Any], Any]
+    dumps: Callable[[Any], bytes]
+    batch: Callable[[List[bytes]], bytes]
+    # Event attribute that caches the frame bytes in this encoding
+    frame_attr: str
+    # Split templates from _empty_status_frames
+    empty_status: Dict[Tuple[TaskState, bool], Tuple[bytes, bytes]]
+    # _failed_status frame split around its text
+    failed_status: Tuple[bytes, bytes]
+
+
+JSON_CODEC = WireCodec(
+    None,
+    _loads,
+    _dumps,
+    _batch_frame,
+    "_ws_frame_json",
+    _empty_status_frames(_dumps),
+    _split_template(_dumps, _failed_status(_TEMPLATE_MARKER)),
+)
+CODECS = {}
+
+if msgpack is not None:
+    # One Packer reused for every event and batch header; msgpack.packb
+    # would build (and tear down) a new one per call
+    _msgpack_packer = msgpack.Packer(use_bin_type=True, default=_default)
+    _MSGPACK_BATCH_PREFIX = b"\x82" + b"".join(
+        msgpack.packb(key) for key in ("type", "batch", "events")
+    )
+    
+    def _msgpack_batch_frame(events: List[bytes]) -> bytes:
+        """Splice already-packed events into a packed batch map."""
+        header = _msgpack_packer.pack_array_header(len(events))
+        return _MSGPACK_BATCH_PREFIX + header + b"".join(events)
+    
+    CODECS["msgpack"] = WireCodec(
+        "msgpack",
+        msgpack.unpackb,
+        _msgpack_packer.pack,
+        _msgpack_batch_frame,
+        "_ws_frame_msgpack",
+        _empty_status_frames(_msgpack_packer.pack),
+        _split_template(_msgpack_packer.pack, _failed_status(_TEMPLATE_MARKER)),
+    )
+
+
+def _negotiate_codec(websocket: WebSocket) -> WireCodec:
+    """Pick the first subprotocol the browser offered that we can speak."""
+    for name in websocket.scope.get("subprotocols", ()):
+        codec = CODECS.get(name)
+        if codec is not None:
+            return codec
+    return JSON_CODEC
+
+
+# Largest chat frame accepted from the page; anything bigger is refused
+# before it is parsed or turned into protocol models
+MAX_MESSAGE_BYTES = 4096
+
+# Largest frame the server will buffer at all. Frames between this and
+# MAX_MESSAGE_BYTES still get an error reply; anything bigger is refused
+# by the WebSocket protocol (close code 1009) before it is read into memory.
+WS_MAX_SIZE = 64 * 1024
+
+
+async def _receive_frame(websocket: WebSocket) -> bytes | str:
+    """
+    Receive one raw frame from the page.
+    
+    The page sends binary frames, which are parsed straight from bytes;
+    text frames are still accepted from older pages.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    data = message.get("bytes")
+    if data is None:
+        data = message["text"]
+    return data
+
+
+def _message_text(frame: bytes | str, codec: WireCodec) -> Optional[str]:
+    """Pull the chat text out of a frame, or None if there isn't any."""
+    try:
+        data = codec.loads(frame)
+    except (TypeError, ValueError):
+        # TypeError: a text frame on a msgpack connection
+        return None
+    if not isinstance(data, dict):
+        return None
+    text = data.get("message")
+    return text if isinstance(text, str) and text else None
+
+
+def _failed_frame(text: str, codec: WireCodec) -> bytes:
+    """Encode a _failed_status frame from the codec's pre-encoded template."""
+    prefix, suffix = codec.failed_status
+    return prefix + codec.dumps(text) + suffix
+
+
+def _parts_payload(parts: List[Any]) -> List[dict]:
+    """Keep the text parts the page can show, as bare {"text": ...} dicts."""
+    return [{"text": p.text} for p in parts if p.__class__ is TextPart]
+
+
+def _encode_status(event: TaskStatusUpdateEvent, codec: WireCodec) -> bytes:
+    """Encode a status event with the fields the page renders."""
+    status = event.status
+    message = status.message
+    if message is None:
+        prefix, suffix = codec.empty_status[status.state, event.final]
+        return prefix + codec.dumps(event.id) + suffix
+    return codec.dumps({
+        "type": "status",
+        "id": event.id,
+        "status": {
+            "state": status.state.value,
+            "message": {"parts": _parts_payload(message.parts)},
+        },
+        "final": event.final,
+    })
+
+
+def _encode_artifact(event: TaskArtifactUpdateEvent, codec: WireCodec) -> bytes:
+    """Encode an artifact event with the fields the page renders."""
+    artifact = event.artifact
+    return codec.dumps({
+        "type": "artifact",
+        "id": event.id,
+        "artifact": {
+            "name": artifact.name,
+            "parts": _parts_payload(artifact.parts),
+        },
+    })
+
+
+def _serialize_event(event: Any, codec: WireCodec = JSON_CODEC) -> Optional[bytes]:
+    """
+    Serialize an agent event for the browser, once per event and codec.
+    
+    The bytes are kept on the event itself, so an event handed to more
+    than one connection, or re-emitted, is not encoded again.
+    """
+    frame = getattr(event, codec.frame_attr, None)
+    if frame is None:
+        if isinstance(event, TaskStatusUpdateEvent):
+            frame = _encode_status(event, codec)
+        elif isinstance(event, TaskArtifactUpdateEvent):
+            frame = _encode_artifact(event, codec)
+        else:
+            return None
+        setattr(event, codec.frame_attr, frame)
+    return frame
+
+
+# Frames a connection may have waiting before the agent stream is paused
+OUTBOX_MAXSIZE = 512
+
+# Upper bounds for one batch frame; anything past them goes in the next
+MAX_BATCH_EVENTS = 128
+MAX_BATCH_BYTES = 256 * 1024
+
+
+async def _writer(
+    websocket: WebSocket,
+    outbox: asyncio.Queue,
+    batch: Callable[[List[bytes]], bytes],
+) -> None:
+    """
+    Send a connection's queued events for as long as it stays open.
+    
+    Each wakeup drains the queue without waiting, so a burst of agent
+    events goes out as one batch frame instead of one frame per event.
+    A batch stops at MAX_BATCH_EVENTS or before it would pass
+    MAX_BATCH_BYTES; the event that didn't fit starts the next one.
+    """
+    get, get_nowait = outbox.get, outbox.get_nowait
+    send = websocket.send_bytes
+    carry = None
+    
+    while True:
+        if carry is None:
+            frame = await get()
+        else:
+            frame, carry = carry, None
+        events = [frame]
+        append = events.append
+        size = len(frame)
+        
+        while len(events) < MAX_BATCH_EVENTS:
+            try:
+                frame = get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            size += len(frame)
+            if size > MAX_BATCH_BYTES:
+                carry = frame
+                break
+            append(frame)
+        await send(batch(events))
+
+
+def get_a2a_client(websocket: WebSocket) -> A2AClient:
+    """Dependency returning the app-wide A2A client."""
+    return websocket.app.state.a2a_client
+
+
+async def _stream_request(
+    client: A2AClient,
+    message: Message,
+    codec: WireCodec,
+    put: Callable[[bytes], Awaitable[None]],
+) -> None:
+    """Stream one request's agent events into the connection's outbox."""
+    serialize = _serialize_event
+    try:
+        async for event in client.send_subscribe(message):
+            frame = serialize(event, codec)
+            if frame is not None:
+                await put(frame)
+    except Exception as e:
+        await put(_failed_frame(f"Error: {str(e)}", codec))
+
+
+async def _serve_messages(
+    websocket: WebSocket,
+    client: A2AClient,
+    codec: WireCodec,
+    outbox: asyncio.Queue,
+) -> None:
+    """Read chat messages from the page and stream each one's events in turn."""
+    put = outbox.put
+    
+    while True:
+        # Receive message from client
+        frame = await _receive_frame(websocket)
+        if len(frame) > MAX_MESSAGE_BYTES:
+            await put(_failed_frame("Error: message is too long", codec))
+            continue
+        
+        message_text = _message_text(frame, codec)
+        if not message_text:
+            continue
+        
+        # Send request over the shared A2A client
+        message = Message(
+            role="user",
+            parts=[TextPart(text=message_text)],
+        )
+        await _stream_request(client, message, codec, put)
 
 
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    client: A2AClient = Depends(get_a2a_client),
+):
     """WebSocket endpoint for streaming A2A events to the browser."""
-    await websocket.accept()
+    codec = _negotiate_codec(websocket)
+    await websocket.accept(subprotocol=codec.subprotocol)
     
+    # One writer per connection, decoupled from the agent stream by a
+    # bounded queue so a slow browser doesn't stall event consumption.
+    # The reader and writer share a task group: when either side sees the
+    # socket close, the other is cancelled, in-flight agent stream included.
+    outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_MAXSIZE)
     try:
-        while True:
-            # Receive message from client
-            data = await websocket.receive_json()
-            message_text = data.get("message", "")
-            
-            if not message_text:
-                continue
-            
-            # Create A2A client and send request
-            async with A2AClient(INTENT_AGENT_URL) as client:
-                message = Message(
-                    role="user",
-                    parts=[TextPart(text=message_text)],
-                )
-                
-                try:
-                    async for event in client.send_subscribe(message):
-                        if isinstance(event, TaskStatusUpdateEvent):
-                            await websocket.send_json({
-                                "type": "status",
-                                "id": event.id,
-                                "status": {
-                                    "state": event.status.state.value,
-                                    "message": {
-                                        "parts": [
-                                            {"text": p.text}
-                                            for p in (event.status.message.parts if event.status.message else [])
-                                            if hasattr(p, "text")
-                                        ]
-                                    } if event.status.message else None,
-                                },
-                                "final": event.final,
-                            })
-                        elif isinstance(event, TaskArtifactUpdateEvent):
-                            await websocket.send_json({
-                                "type": "artifact",
-                                "id": event.id,
-                                "artifact": {
-                                    "name": event.artifact.name,
-                                    "parts": [
-                                        {"text": p.text}
-                                        for p in event.artifact.parts
-                                        if hasattr(p, "text")
-                                    ],
-                                },
-                            })
-                except Exception as e:
-                    await websocket.send_json({
-                        "type": "status",
-                        "status": {
-                            "state": "failed",
-                            "message": {"parts": [{"text": f"Error: {str(e)}"}]},
-                        },
-                        "final": True,
-                    })
-                    
-    except WebSocketDisconnect:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_writer(websocket, outbox, codec.batch))
+            tg.create_task(_serve_messages(websocket, client, codec, outbox))
+    except* WebSocketDisconnect:
         pass
 
 
@@ -895,11 +659,30 @@ if __name__ == "__main__":
     print(f"   Open http://localhost:{args.port} in your browser")
     print(f"   Connecting to Intent Agent at {INTENT_AGENT_URL}\n")
     
+    try:
+        import uvloop  # noqa: F401  installed with uvicorn[standard] on POSIX
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
+    # uvloop and httptools come with uvicorn[standard]; the access log is
+    # off because the demo's traffic is one page load plus a WebSocket.
+    # permessage-deflate compresses the batch frames, which are mostly
+    # repetitive JSON and artifact text, whenever the browser offers it.
+    # Incoming frames are capped at WS_MAX_SIZE instead of the 16 MiB
+    # default; keepalive pings stay on so connections from closed tabs
+    # are still noticed.
     uvicorn.run(
         app,
         host=args.host,
         port=args.port,
-        log_level="info",
+        loop=loop,
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=True,
+        ws_max_size=WS_MAX_SIZE,
+        log_level="warning",
+        access_log=False,
     )
 
 
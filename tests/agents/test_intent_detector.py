@@ -2,6 +2,8 @@
 Tests for Intent Detector.
 """
 
+import asyncio
+
 import pytest
 from agents.intent_agent.intent_detector import (
     Intent,
@@ -14,7 +16,7 @@ from agents.intent_agent.intent_detector import (
 class TestIntentDetectorMock:
     """Tests for mock intent detector."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         """Create a mock detector instance."""
         return IntentDetectorMock()
@@ -28,8 +30,8 @@ class TestIntentDetectorMock:
             "Please cancel my reservation",
         ]
         
-        for msg in messages:
-            result = await detector.detect(msg)
+        results = await asyncio.gather(*(detector.detect(msg) for msg in messages))
+        for msg, result in zip(messages, results):
             assert result.intent == Intent.BOOKING, f"Failed for: {msg}"
     
     async def test_detect_billing_intent(self, detector):
@@ -41,8 +43,8 @@ class TestIntentDetectorMock:
             "What's my account balance?",
         ]
         
-        for msg in messages:
-            result = await detector.detect(msg)
+        results = await asyncio.gather(*(detector.detect(msg) for msg in messages))
+        for msg, result in zip(messages, results):
             assert result.intent == Intent.BILLING, f"Failed for: {msg}"
     
     async def test_detect_general_intent(self, detector):
@@ -53,8 +55,8 @@ class TestIntentDetectorMock:
             "Tell me about your company",
         ]
         
-        for msg in messages:
-            result = await detector.detect(msg)
+        results = await asyncio.gather(*(detector.detect(msg) for msg in messages))
+        for msg, result in zip(messages, results):
             assert result.intent == Intent.GENERAL, f"Failed for: {msg}"
     
     async def test_returns_intent_result(self, detector):
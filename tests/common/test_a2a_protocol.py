@@ -176,8 +176,8 @@ class TestGenerateId:
     
     def test_generate_id_is_unique(self):
         """Test that generated IDs are unique."""
-        ids = [generate_id() for _ in range(100)]
-        assert len(ids) == len(set(ids))
+        n = 10_000
+        assert len({generate_id() for _ in range(n)}) == n
     
     def test_generate_id_is_string(self):
         """Test that generated ID is a string."""
@@ -14,6 +14,7 @@ from common.a2a_protocol import (
     TaskStatusUpdateEvent,
     TaskArtifactUpdateEvent,
     Artifact,
+    Message,
     TextPart,
 )
 
@@ -57,6 +58,65 @@ class TestRedisManagerTaskStorage:
         retrieved = await redis_manager.get_task("test-task-2")
         assert retrieved.status.state == TaskState.WORKING
     
+    async def test_update_status_of_missing_task(self, redis_manager: RedisManager):
+        """Test that updating an unknown task does not create it."""
+        await redis_manager.update_task_status(
+            "missing-task",
+            TaskStatus(state=TaskState.WORKING),
+        )
+        
+        assert await redis_manager.get_task("missing-task") is None
+    
+    async def test_update_task_status_keeps_other_fields(
+        self, redis_manager: RedisManager
+    ):
+        """Test that a status update leaves the rest of the stored task intact."""
+        task = Task(
+            id="patch-task",
+            sessionId='session "status": {',
+            status=TaskStatus(
+                state=TaskState.SUBMITTED,
+                message=Message(
+                    role="agent",
+                    parts=[TextPart(text='} "status": {"state": "failed"}')],
+                    metadata={"status": {"nested": "}"}},
+                ),
+            ),
+            history=[],
+            artifacts=[Artifact(parts=[TextPart(text="result")])],
+            metadata={"status": "kept"},
+        )
+        await redis_manager.store_task(task)
+        
+        status = TaskStatus(state=TaskState.WORKING)
+        await redis_manager.update_task_status("patch-task", status)
+        
+        retrieved = await redis_manager.get_task("patch-task")
+        assert retrieved == task.model_copy(update={"status": status})
+    
+    async def test_forget_task_keeps_data(self, redis_manager: RedisManager):
+        """Test that forgetting a task releases cached state but keeps its data."""
+        task = Task(
+            id="forget-task",
+            status=TaskStatus(state=TaskState.COMPLETED),
+        )
+        await redis_manager.store_task(task)
+        
+        redis_manager.publish_status_nowait(
+            "forget-task",
+            TaskStatusUpdateEvent(
+                id="forget-task",
+                status=TaskStatus(state=TaskState.COMPLETED),
+            ),
+        )
+        
+        redis_manager.forget_task("forget-task")
+        await redis_manager.flush_publishes("forget-task")
+        
+        assert "forget-task" not in redis_manager._keys
+        assert "forget-task" not in redis_manager._stream_ttl_refreshed_at
+        assert await redis_manager.get_task("forget-task") is not None
+    
     async def test_delete_task(self, redis_manager: RedisManager):
         """Test deleting a task."""
         task = Task(
@@ -137,6 +197,37 @@ class TestRedisManagerPubSub:
         
         # Should not raise
         await redis_manager.publish_artifact("task-pubsub-2", event)
+    
+    async def test_publish_nowait_preserves_order(self, redis_manager: RedisManager):
+        """Test that scheduled publishes reach the stream in order."""
+        task_id = "task-pubsub-3"
+        
+        redis_manager.publish_status_nowait(
+            task_id,
+            TaskStatusUpdateEvent(
+                id=task_id,
+                status=TaskStatus(state=TaskState.WORKING),
+            ),
+        )
+        redis_manager.publish_artifact_nowait(
+            task_id,
+            TaskArtifactUpdateEvent(
+                id=task_id,
+                artifact=Artifact(name="result", parts=[TextPart(text="Result")]),
+            ),
+        )
+        redis_manager.publish_status_nowait(
+            task_id,
+            TaskStatusUpdateEvent(
+                id=task_id,
+                status=TaskStatus(state=TaskState.COMPLETED),
+                final=True,
+            ),
+        )
+        await redis_manager.flush_publishes(task_id)
+        
+        events = await redis_manager.get_stream_events(task_id)
+        assert [e["event"] for e in events] == ["status", "artifact", "status"]
 
 
 @pytest.mark.asyncio
@@ -148,22 +239,21 @@ class TestRedisManagerStreams:
         task_id = "task-stream-1"
         
         # Publish some events
-        await redis_manager.publish_status(
+        await redis_manager.publish_many(
             task_id,
-            TaskStatusUpdateEvent(
-                id=task_id,
-                status=TaskStatus(state=TaskState.WORKING),
-            ),
-        )
-        await redis_manager.publish_artifact(
-            task_id,
-            TaskArtifactUpdateEvent(
-                id=task_id,
-                artifact=Artifact(
-                    name="result",
-                    parts=[TextPart(text="Result")],
+            [
+                TaskStatusUpdateEvent(
+                    id=task_id,
+                    status=TaskStatus(state=TaskState.WORKING),
                 ),
-            ),
+                TaskArtifactUpdateEvent(
+                    id=task_id,
+                    artifact=Artifact(
+                        name="result",
+                        parts=[TextPart(text="Result")],
+                    ),
+                ),
+            ],
         )
         
         # Read events from stream
@@ -172,13 +262,33 @@ class TestRedisManagerStreams:
         assert len(events) == 2
         assert events[0]["event"] == "status"
         assert events[1]["event"] == "artifact"
+        assert TaskStatusUpdateEvent.model_validate_json(events[0]["data"]).status.state == TaskState.WORKING
     
     async def test_stream_respects_limit(self, redis_manager: RedisManager):
         """Test that stream respects event limit."""
         task_id = "task-stream-2"
         
         # Publish multiple events
-        for i in range(5):
+        await redis_manager.publish_many(
+            task_id,
+            [
+                TaskStatusUpdateEvent(
+                    id=task_id,
+                    status=TaskStatus(state=TaskState.WORKING),
+                )
+                for i in range(5)
+            ],
+        )
+        
+        # Read with limit
+        events = await redis_manager.get_stream_events(task_id, limit=3)
+        assert len(events) == 3
+    
+    async def test_stream_has_ttl(self, redis_manager: RedisManager):
+        """Test that the stream TTL is set once and not dropped by later events."""
+        task_id = "task-stream-3"
+        
+        for i in range(3):
             await redis_manager.publish_status(
                 task_id,
                 TaskStatusUpdateEvent(
@@ -187,9 +297,8 @@ class TestRedisManagerStreams:
                 ),
             )
         
-        # Read with limit
-        events = await redis_manager.get_stream_events(task_id, limit=3)
-        assert len(events) == 3
+        key = f"{RedisManager.TASK_KEY_PREFIX}{task_id}{RedisManager.STREAM_KEY_SUFFIX}"
+        assert await redis_manager.client.ttl(key) > 0
 
 
 @pytest.mark.asyncio
@@ -206,12 +315,27 @@ class TestRedisManagerUtilities:
             )
             await redis_manager.store_task(task)
         
-        task_ids = await redis_manager.get_active_tasks()
+        task_ids = set(await redis_manager.get_active_tasks())
+        
+        assert {"active-task-0", "active-task-1", "active-task-2"} <= task_ids
+    
+    async def test_iter_active_tasks_skips_streams(self, redis_manager: RedisManager):
+        """Test that iterating active tasks yields task IDs but not stream keys."""
+        task_id = "active-task-stream"
+        await redis_manager.store_task(
+            Task(id=task_id, status=TaskStatus(state=TaskState.WORKING))
+        )
+        await redis_manager.publish_status(
+            task_id,
+            TaskStatusUpdateEvent(
+                id=task_id,
+                status=TaskStatus(state=TaskState.WORKING),
+            ),
+        )
+        
+        task_ids = [t async for t in redis_manager.iter_active_tasks()]
         
-        assert len(task_ids) >= 3
-        assert "active-task-0" in task_ids
-        assert "active-task-1" in task_ids
-        assert "active-task-2" in task_ids
+        assert task_ids == [task_id]
 
 
 
@@ -8,6 +8,7 @@ from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 import redis.exceptions
 
 # Add project root to path
@@ -17,9 +18,22 @@ from common.redis_manager import RedisManager
 from common.a2a_protocol import Message, TextPart
 
 
-@pytest_asyncio.fixture
-async def redis_manager() -> AsyncGenerator[RedisManager, None]:
-    """Create a Redis manager connected to test Redis."""
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test on the session event loop shared with Redis.
+    
+    Fixture loops are set to session scope in pyproject.toml; test loops
+    have no ini option in this pytest-asyncio release, so mark them here.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def redis_session_manager() -> AsyncGenerator[RedisManager, None]:
+    """Create one Redis manager connected to test Redis for the whole session."""
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
     manager = RedisManager(url=redis_url, db=15)  # Use db 15 for tests
     
@@ -33,11 +47,12 @@ async def redis_manager() -> AsyncGenerator[RedisManager, None]:
         except ImportError:  # pragma: no cover
             pytest.skip("Redis not available and fakeredis not installed")
         manager._client = fakeredis_aioredis.FakeRedis(decode_responses=True, db=15)
+    
+    try:
         yield manager
     finally:
         # Cleanup test data
-        if manager._client:
-            await manager._client.flushdb()
+        await manager._client.flushdb()
         # RedisManager.disconnect() assumes an awaitable close() method; fakeredis
         # provides that, but guard just in case.
         try:
@@ -46,7 +61,18 @@ async def redis_manager() -> AsyncGenerator[RedisManager, None]:
             pass
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
+async def redis_manager(
+    redis_session_manager: RedisManager,
+) -> AsyncGenerator[RedisManager, None]:
+    """Hand each test the shared Redis manager with an empty database."""
+    # Let publishes from the previous test land before wiping the database
+    await redis_session_manager.reset_local_state()
+    await redis_session_manager._client.flushdb()
+    yield redis_session_manager
+
+
+@pytest.fixture(scope="session")
 def sample_message() -> Message:
     """Create a sample user message."""
     return Message(
@@ -55,7 +81,7 @@ def sample_message() -> Message:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def booking_message() -> Message:
     """Create a booking-related message."""
     return Message(
@@ -64,7 +90,7 @@ def booking_message() -> Message:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def billing_message() -> Message:
     """Create a billing-related message."""
     return Message(
@@ -73,7 +99,7 @@ def billing_message() -> Message:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def general_message() -> Message:
     """Create a general inquiry message."""
     return Message(